@@ -3,30 +3,63 @@ from __future__ import annotations
 import os
 import json
 import csv
-from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Any
+import gzip
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from dataclasses import dataclass, asdict, fields
+from operator import attrgetter
+from typing import Optional, List, Dict, Any, FrozenSet
 import re
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from fase2_musicbrainz.models import TrackMetadataBase, MBRelease
 
 
 # ------------------------------------------------------
 # NORMALIZACIÓN Y SIMILITUD
 # ------------------------------------------------------
+_RE_PAREN = re.compile(r"\(.*?\)")
+_RE_BRACK = re.compile(r"\[.*?\]")
+_RE_WS = re.compile(r"\s+")
+# Keywords de versión (coincidencia por substring, como el `in` original)
+_REMIX_RE = re.compile(
+    r"(?:remix|extended|club\s+mix|edit|mix|dub|instrumental|radio\s+edit|bootleg|version)"
+)
+_QUOTE_TABLE = str.maketrans({"\u2019": "'", "\u201c": '"', "\u201d": '"'})
+
+
+@lru_cache(maxsize=8192)
 def _normalize(text: str) -> str:
     text = text.lower()
-    text = re.sub(r"\(.*?\)", "", text)
-    text = re.sub(r"\[.*?\]", "", text)
-    text = text.replace("’", "'").replace("“", '"').replace("”", '"')
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _RE_PAREN.sub("", text)
+    text = _RE_BRACK.sub("", text)
+    text = text.translate(_QUOTE_TABLE)
+    text = _RE_WS.sub(" ", text).strip()
     return text
 
 
+@lru_cache(maxsize=8192)
+def _token_set(text: str) -> FrozenSet[str]:
+    # Cacheado: en matching masivo cada título se tokeniza una sola vez.
+    # Sets y no bitmasks de un vocabulario global: en una pasada grande los ids
+    # crecen y cada máscara pasaría a costar lo que el vocabulario, no el título.
+    return frozenset(text.split())
+
+
 def _similarity_basic(t1: Optional[str], t2: Optional[str]) -> float:
     if not t1 or not t2:
         return 0.0
 
+    # Atajo: strings idénticos no necesitan normalizarse
+    if t1 is t2 or t1 == t2:
+        return 1.0
+
     n1 = _normalize(t1)
     n2 = _normalize(t2)
 
@@ -36,34 +69,29 @@ def _similarity_basic(t1: Optional[str], t2: Optional[str]) -> float:
     if n1 in n2 or n2 in n1:
         return 0.8
 
-    set1 = set(n1.split())
-    set2 = set(n2.split())
-    if not set1 or not set2:
+    s1 = _token_set(n1)
+    s2 = _token_set(n2)
+    if not s1 or not s2:
         return 0.0
 
-    inter = set1.intersection(set2)
-    union = set1.union(set2)
-    return len(inter) / len(union) if union else 0.0
+    inter = len(s1 & s2)
+    return inter / (len(s1) + len(s2) - inter)
 
 
 def _remix_keywords_score(tag_title: Optional[str], cand_title: Optional[str]) -> float:
     if not tag_title or not cand_title:
         return 0.0
 
-    kw = [
-        "remix", "extended", "club mix", "edit", "mix", "dub",
-        "instrumental", "radio edit", "bootleg", "version"
-    ]
-
     t1 = _normalize(tag_title)
     t2 = _normalize(cand_title)
 
-    tag_hits = sum(1 for k in kw if k in t1)
-    cand_hits = sum(1 for k in kw if k in t2)
+    # Solo importa la presencia de alguna keyword, no cuántas hay
+    tag_hits = _REMIX_RE.search(t1) is not None
+    cand_hits = _REMIX_RE.search(t2) is not None
 
-    if tag_hits > 0 and cand_hits > 0:
+    if tag_hits and cand_hits:
         return 0.5
-    if (tag_hits > 0 and cand_hits == 0) or (tag_hits == 0 and cand_hits > 0):
+    if tag_hits != cand_hits:
         return -0.2
     return 0.0
 
@@ -113,6 +141,11 @@ def classify_confidence(track_meta: TrackMetadataBase) -> (str, float):
 
     score_ac = track_meta.acoustid_score or 0.0
 
+    # Por debajo de 0.94 la etiqueta es REVISAR_MANUAL sin importar la similitud:
+    # no vale la pena normalizar/comparar títulos y artistas
+    if score_ac < 0.94:
+        return "REVISAR_MANUAL", float(score_ac)
+
     tags = track_meta.original_tags or {}
     tag_title = str(tags.get("TIT2")) if tags.get("TIT2") else None
     tag_artist = str(tags.get("TPE1")) if tags.get("TPE1") else None
@@ -138,11 +171,46 @@ def classify_confidence(track_meta: TrackMetadataBase) -> (str, float):
 # ------------------------------------------------------
 # EXPORTACIÓN JSON / CSV A CARPETA “resultados”
 # ------------------------------------------------------
+def _write_json(json_path: str, results: List[TrackAnalysisResult], compress: bool = False) -> None:
+    # Se escribe a un temporal y se renombra: nunca queda un fichero a medias
+    tmp_path = json_path + ".tmp"
+    # gzip nivel 1: la mayor parte de la reducción de tamaño con coste de CPU mínimo
+    opener = partial(gzip.open, compresslevel=1) if compress else open
+    if HAS_ORJSON:
+        # orjson serializa dataclasses directamente, sin la lista intermedia de asdict
+        with opener(tmp_path, "wb") as f_json:
+            f_json.write(orjson.dumps(
+                results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS,
+            ))
+    else:
+        with opener(tmp_path, "wt", encoding="utf-8") as f_json:
+            json.dump([asdict(r) for r in results], f_json, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, json_path)
+
+
+def _write_csv(csv_path: str, results: List[TrackAnalysisResult]) -> None:
+    tmp_path = csv_path + ".tmp"
+    # Filas como tuplas vía attrgetter: sin construir un dict por fila
+    fieldnames = [f.name for f in fields(TrackAnalysisResult)]
+    getter = attrgetter(*fieldnames)
+    with open(tmp_path, "w", encoding="utf-8", newline="", buffering=1024 * 1024) as f_csv:
+        writer = csv.writer(f_csv)
+        writer.writerow(fieldnames)
+        writer.writerows(getter(r) for r in results)
+    os.replace(tmp_path, csv_path)
+
+
 def export_results(
     results: List[TrackAnalysisResult],
     base_dir: str,
     base_name: str = "resultados_fase1_fase2",
+    compress: bool = False,
 ) -> None:
+    """
+    Exporta los resultados a JSON y CSV en <base_dir>/resultados.
+    Con compress=True el JSON se escribe como .json.gz.
+    """
     if not results:
         print("No hay resultados para exportar.")
         return
@@ -151,26 +219,27 @@ def export_results(
     output_dir = os.path.join(base_dir, "resultados")
     os.makedirs(output_dir, exist_ok=True)
 
-    # Timestamp YYYYMMDD-HH:MM:SS
-    timestamp = datetime.now().strftime("%Y%m%d-%H:%M:%S")
+    # Timestamp YYYYMMDD-HHMMSS (sin ':' para que el nombre sea válido en Windows/SMB)
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
 
-    json_filename = f"{timestamp}-{base_name}.json"
+    json_filename = f"{timestamp}-{base_name}.json" + (".gz" if compress else "")
     csv_filename = f"{timestamp}-{base_name}.csv"
 
     json_path = os.path.join(output_dir, json_filename)
     csv_path = os.path.join(output_dir, csv_filename)
 
-    # JSON
-    with open(json_path, "w", encoding="utf-8") as f_json:
-        json.dump([asdict(r) for r in results], f_json, ensure_ascii=False, indent=2)
-
-    # CSV
-    fieldnames = list(asdict(results[0]).keys())
-    with open(csv_path, "w", encoding="utf-8", newline="") as f_csv:
-        writer = csv.DictWriter(f_csv, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in results:
-            writer.writerow(asdict(r))
+    # JSON y CSV son independientes: se escriben en paralelo
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        futures = [
+            ex.submit(_write_json, json_path, results, compress),
+            ex.submit(_write_csv, csv_path, results),
+        ]
+        for fut in futures:
+            fut.result()
+
+    # Liberar cachés de normalización/tokens entre exportaciones
+    _normalize.cache_clear()
+    _token_set.cache_clear()
 
     print("\n=== EXPORTACIÓN COMPLETADA ===")
     print("JSON:", json_path)
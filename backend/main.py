@@ -16,6 +16,7 @@ def main():
     parser.add_argument("--write", "-w", action="store_true", help="Ejecutar escritura real de archivos")
     parser.add_argument("--dry-run", action="store_true", help="Modo simulación (No modifica archivos)")
     parser.add_argument("--no-discogs", action="store_true", help="Saltar búsqueda en Discogs")
+    parser.add_argument("--force-refetch", action="store_true", help="Consultar los servicios aunque el archivo ya tenga tags completos")
     
     args = parser.parse_args()
     
@@ -51,7 +52,7 @@ def main():
     logger.info(f"Output: {args.output_path}")
 
     try:
-        manager = LibraryManager(use_discogs=use_discogs, dry_run=dry_run)
+        manager = LibraryManager(use_discogs=use_discogs, dry_run=dry_run, force_refetch=args.force_refetch)
         manager.process_library(args.input_path, args.output_path)
     except Exception as e:
         logger.critical(f"Error fatal: {e}", exc_info=True)
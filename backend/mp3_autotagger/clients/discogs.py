@@ -7,6 +7,12 @@ from typing import Any, Dict, Optional
 
 import requests
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from mp3_autotagger.config import DISCOGS_TOKEN, USER_AGENT
 
 
@@ -22,20 +28,21 @@ class DiscogsClient:
     """
     Cliente mínimo para la API de Discogs, usando autenticación por token.
 
-    - Respeta un delay mínimo entre requests (min_delay).
+    - Respeta un delay mínimo entre requests (min_delay), también entre hilos.
     - Envuelve errores de red y HTTP en DiscogsClientError.
     """
     base_url: str = "https://api.discogs.com"
     token: Optional[str] = DISCOGS_TOKEN
     user_agent: str = USER_AGENT
-    min_delay: float = 1.0  # segundos entre requests para ser amable con la API
+    min_delay: float = 1.1  # segundos entre requests: <60 rpm, el límite autenticado de Discogs
 
     def __post_init__(self) -> None:
         if not self.token:
             raise RuntimeError("DISCOGS_TOKEN no está configurado en .env / config.")
 
         # Usar caché separado para Discogs
-        self.session = get_cached_session(cache_name="discogs_cache")
+        # Los releases de Discogs casi no cambian: un rescan debe salir de disco
+        self.session = get_cached_session(cache_name="discogs_cache", expire_after_days=30)
         
         self.session.headers.update(
             {
@@ -43,6 +50,7 @@ class DiscogsClient:
                 "Authorization": f"Discogs token={self.token}",
             }
         )
+        # Reloj monotónico: instante reservado para la última request
         self._last_request_time = 0.0
         self._lock = threading.Lock()
 
@@ -54,100 +62,125 @@ class DiscogsClient:
     # Utilidades internas
     # --------------------------------------------------------
 
-    def _sleep_if_needed(self) -> None:
-        """Respeta min_delay entre llamadas para no saturar la API. Debe llamarse bajo lock."""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self.min_delay:
-            time.sleep(self.min_delay - elapsed)
+    def _reserve_slot(self) -> None:
+        """
+        Reserva el siguiente turno libre respetando min_delay y duerme fuera
+        del lock hasta que llegue. Así varias búsquedas pueden estar en vuelo a
+        la vez sin superar el ritmo de 1 request / min_delay (60 rpm).
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._last_request_time + self.min_delay)
+            self._last_request_time = slot
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _pause_all(self, seconds: float) -> None:
+        """Empuja el próximo turno `seconds` hacia delante para todos los hilos."""
+        with self._lock:
+            self._last_request_time = max(self._last_request_time, time.monotonic() + seconds)
+
+    def _cached_response(self, method: str, url: str, params: Optional[Dict[str, Any]]) -> Optional[Any]:
+        """
+        Devuelve la respuesta guardada en la caché SQLite, o None si no la hay
+        (o si la sesión no es un CachedSession de requests-cache).
+        """
+        if not hasattr(self.session, "cache"):
+            return None
+        resp = self.session.request(
+            method=method.upper(),
+            url=url,
+            params=params,
+            only_if_cached=True,
+        )
+        # requests-cache responde 504 cuando la entrada no está cacheada
+        if resp.status_code == 504 or not getattr(resp, "from_cache", False):
+            return None
+        return resp
 
     def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
         Envuelve requests.request con:
-        - THREAD SAFETY (Lock)
+        - THREAD SAFETY (turnos reservados bajo lock, request fuera de él)
         - loop infinito de reintento en 429 (Rate Limit).
-        - espera forzosa de 65s en 429.
-        - espera preventiva de 1.1s tras éxito.
+        - espera forzosa de 65s en 429 (compartida por todos los hilos).
         """
         url = f"{self.base_url}{path}"
         
         # Bucle infinito de intentos (Ticket Crítico: Paciencia del Robot)
         while True:
-            with self._lock:
-                self._sleep_if_needed()
-                
-                try:
+            try:
+                # Un hit de caché no toca la red: no consume turno del rate limiter
+                resp = self._cached_response(method, url, params)
+                if resp is None:
+                    self._reserve_slot()
                     resp = self.session.request(
                         method=method.upper(),
                         url=url,
                         params=params,
                         timeout=20,
                     )
+                
+                # 1. Manejo explícito de 429 (Too Many Requests) - ZONA DE ESPERA
+                # Forzamos conversión a int por si alguna librería intermedia (cache?) lo devuelve como str
+                try:
+                    code = int(resp.status_code)
+                except:
+                    code = 0
+                
+                if code == 429:
+                    print(f"[ALERTA] Límite de API alcanzado (429) en {url}.")
+                    print("[ALERTA] El sistema está durmiendo 65 segundos... Zzz...")
                     
-                    # Actualizamos tiempo de request
-                    self._last_request_time = time.time()
-                    
-                    # 1. Manejo explícito de 429 (Too Many Requests) - ZONA DE ESPERA
-                    # Forzamos conversión a int por si alguna librería intermedia (cache?) lo devuelve como str
-                    try:
-                        code = int(resp.status_code)
-                    except:
-                        code = 0
-                    
-                    if code == 429:
-                        print(f"[ALERTA] Límite de API alcanzado (429) en {url}.")
-                        print("[ALERTA] El sistema está durmiendo 65 segundos... Zzz...")
-                        
-                        # ANTI-CACHE: Si estamos usando cache y recibimos 429, BORRAR esa entrada
-                        # para evitar leer el 429 del cache en el siguiente loop.
-                        if hasattr(self.session, 'cache'):
-                            try:
-                                self.session.cache.delete_url(url)
-                                print("[Internal] Entrada de caché 429 invalidada.")
-                            except Exception:
-                                pass
-
-                        # Pausa absoluta del hilo por 65s
-                        time.sleep(65.0)
-                        
-                        # Reintentar inmediatamente loop
-                        continue
-                    
-                    # 2. Manejo de 404 (Not Found) -> None
-                    if resp.status_code == 404:
-                        return None
-                    
-                    # 3. Otros errores HTTP (500, 401, etc)
-                    if resp.status_code >= 400:
-                        text_preview = resp.text[:300]
-                        raise DiscogsClientError(
-                            f"Discogs devolvió error HTTP {resp.status_code}: {text_preview}"
-                        )
-                        
-                    # 4. Éxito (200 OK)
-                    # Pausa preventiva para no saturar
-                    time.sleep(1.1)
+                    # ANTI-CACHE: Si estamos usando cache y recibimos 429, BORRAR esa entrada
+                    # para evitar leer el 429 del cache en el siguiente loop.
+                    if hasattr(self.session, 'cache'):
+                        try:
+                            self.session.cache.delete_url(url)
+                            print("[Internal] Entrada de caché 429 invalidada.")
+                        except Exception:
+                            pass
+
+                    # Pausa absoluta de 65s: el resto de hilos espera también su turno
+                    self._pause_all(65.0)
                     
-                    # 5. Rate Limit Proactivo (Optimización "Smart Robot")
-                    # Leemos los headers para saber cuánto nos queda antes del bloqueo
-                    try:
-                        remaining = int(resp.headers.get("X-Discogs-Ratelimit-Remaining", 60))
-                        if remaining < 2:
-                            print(f"[Discogs] Rate Limit Buffer bajo ({remaining}). Pausa preventiva de 5s...")
-                            time.sleep(5.0)
-                    except Exception:
-                        pass
+                    # Reintentar (el siguiente turno ya cae tras la pausa)
+                    continue
+                
+                # 2. Manejo de 404 (Not Found) -> None
+                if resp.status_code == 404:
+                    return None
+                
+                # 3. Otros errores HTTP (500, 401, etc)
+                if resp.status_code >= 400:
+                    text_preview = resp.text[:300]
+                    raise DiscogsClientError(
+                        f"Discogs devolvió error HTTP {resp.status_code}: {text_preview}"
+                    )
                     
-                    try:
-                        return resp.json()
-                    except ValueError as e:
-                         # Si el contenido no es json válido
-                        raise DiscogsClientError(f"Respuesta JSON inválida desde Discogs ({url}).") from e
-
-                except requests.exceptions.ReadTimeout as e:
-                    raise DiscogsClientError(f"Timeout al llamar a Discogs ({url}): {e}") from e
-                except requests.RequestException as e:
-                    raise DiscogsClientError(f"Error de red al llamar a Discogs ({url}): {e}") from e
+                # 4. Éxito (200 OK)
+                # 5. Rate Limit Proactivo (Optimización "Smart Robot")
+                # Leemos los headers para saber cuánto nos queda antes del bloqueo
+                try:
+                    remaining = int(resp.headers.get("X-Discogs-Ratelimit-Remaining", 60))
+                    if remaining < 2:
+                        print(f"[Discogs] Rate Limit Buffer bajo ({remaining}). Pausa preventiva de 5s...")
+                        self._pause_all(5.0)
+                except Exception:
+                    pass
+                
+                try:
+                    if HAS_ORJSON:
+                        return orjson.loads(resp.content)
+                    return resp.json()
+                except ValueError as e:  # orjson.JSONDecodeError hereda de ValueError
+                     # Si el contenido no es json válido
+                    raise DiscogsClientError(f"Respuesta JSON inválida desde Discogs ({url}).") from e
+
+            except requests.exceptions.ReadTimeout as e:
+                raise DiscogsClientError(f"Timeout al llamar a Discogs ({url}): {e}") from e
+            except requests.RequestException as e:
+                raise DiscogsClientError(f"Error de red al llamar a Discogs ({url}): {e}") from e
 
     # --------------------------------------------------------
     # Métodos públicos específicos
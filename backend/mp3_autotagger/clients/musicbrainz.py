@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional, Dict, Any, List
 
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from mp3_autotagger.core.models import MBArtist, MBRelease, MBRecording
 
 
@@ -24,6 +34,33 @@ USER_AGENT = os.getenv(
 
 MUSICBRAINZ_BASE_URL = "https://musicbrainz.org/ws/2"
 
+# Campos escalares de un release, extraídos en una sola llamada C
+_REL_FIELDS = itemgetter("id", "title", "date", "country", "status")
+
+
+def _parse_release(rel: Dict[str, Any]) -> MBRelease:
+    try:
+        r_id, r_title, r_date, r_country, r_status = _REL_FIELDS(rel)
+    except KeyError:
+        # MB omite a veces date/country en releases incompletos
+        r_id, r_title, r_date, r_country, r_status = (
+            rel.get("id"), rel.get("title"), rel.get("date"), rel.get("country"), rel.get("status")
+        )
+
+    rg = rel.get("release-group") or {}
+
+    return MBRelease(
+        id=r_id,
+        title=r_title,
+        date=r_date,  # "YYYY-MM-DD" o "YYYY"
+        country=r_country,
+        status=r_status,
+        release_group_id=rg.get("id"),
+        release_group_type=rg.get("primary-type"),
+        # Media Formats
+        media_formats=[f for f in (m.get("format") for m in rel.get("media") or []) if f],
+    )
+
 
 # ---------------------------------------------------------------------
 # CLIENTE MUSICBRAINZ
@@ -39,10 +76,24 @@ class MusicBrainzClient:
         self.user_agent = user_agent or USER_AGENT
         self.min_delay = min_delay
         self._last_request_ts: float = 0.0
+        self._lock = threading.Lock()
         
         # Inicializar sesión con caché
         self.session = get_cached_session(cache_name="mb_cache")
 
+        # Pool de conexiones keep-alive: reutiliza la conexión TLS entre llamadas
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "User-Agent": self.user_agent,
+            "Connection": "keep-alive",
+        })
+
+        # Memo en memoria por recording_id: el mismo tema repetido en varias
+        # carpetas no vuelve a parsear ni a consultar la caché en disco
+        self._recording_memo = lru_cache(maxsize=4096)(self._fetch_recording)
+
     # -------------------------
     # Throttling
     # -------------------------
@@ -50,19 +101,41 @@ class MusicBrainzClient:
         """
         Respeta el tiempo mínimo entre llamadas para cumplir buenas prácticas
         de MusicBrainz. Evita saturar el servicio.
+
+        Es seguro entre hilos: cada llamada reserva su turno bajo lock y duerme
+        fuera de él, así los workers no serializan el resto de su trabajo.
+        """
+        with self._lock:
+            # Reloj monotónico: inmune a ajustes del reloj del sistema (NTP)
+            now = time.monotonic()
+            elapsed = now - self._last_request_ts
+            if elapsed < self.min_delay:
+                sleep_for = self.min_delay - elapsed
+                self._last_request_ts = now + sleep_for
+            else:
+                sleep_for = 0.0
+                self._last_request_ts = now
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+
+    def _cached_response(self, url: str, params: Dict[str, Any]) -> Optional[requests.Response]:
+        """
+        Respuesta guardada en la caché de requests-cache, o None si no la hay
+        (o si la sesión no es un CachedSession).
         """
-        now = time.time()
-        elapsed = now - self._last_request_ts
-        if elapsed < self.min_delay:
-            time.sleep(self.min_delay - elapsed)
-        self._last_request_ts = time.time()
+        if not hasattr(self.session, "cache"):
+            return None
+        resp = self.session.get(url, params=params, only_if_cached=True)
+        # requests-cache responde 504 cuando la entrada no está cacheada
+        if resp.status_code == 504 or not getattr(resp, "from_cache", False):
+            return None
+        return resp
 
     # -------------------------
     # Método GET genérico
     # -------------------------
     def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         url = f"{MUSICBRAINZ_BASE_URL}/{path}"
-        headers = {"User-Agent": self.user_agent}
 
         if params is None:
             params = {}
@@ -72,16 +145,20 @@ class MusicBrainzClient:
         backoff = 2
 
         for attempt in range(max_retries):
-            self._throttle()
             try:
-                # Usar la sesión con caché
-                resp = self.session.get(url, headers=headers, params=params, timeout=30)
+                # Un hit de la caché SQLite no toca la red: no pasa por el throttle
+                resp = self._cached_response(url, params)
+                if resp is None:
+                    self._throttle()
+                    resp = self.session.get(url, params=params, timeout=30)
                 
                 # Debug: Saber si vino del caché
                 if hasattr(resp, 'from_cache') and resp.from_cache:
                     pass
 
                 resp.raise_for_status()
+                if HAS_ORJSON:
+                    return orjson.loads(resp.content)
                 return resp.json()
                 
             except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
@@ -105,64 +182,39 @@ class MusicBrainzClient:
     # Obtener información de RECORDING
     # -------------------------
     def get_recording(self, recording_id: str) -> Optional[MBRecording]:
-        path = f"recording/{recording_id}"
-        params = {"inc": "artists+releases+release-groups+tags+genres+isrcs+media"}
-
         try:
-            data = self._get(path, params=params)
+            return self._recording_memo(recording_id)
         except requests.RequestException as e:
             print(f"Error consultando MusicBrainz para recording_id={recording_id}: {e}")
             return None
 
+    def _fetch_recording(self, recording_id: str) -> MBRecording:
+        """
+        Pide y parsea un recording. Lanza RequestException en error: así el
+        memo de la corrida (lru_cache, ver __init__) solo guarda éxitos.
+        """
+        path = f"recording/{recording_id}"
+        params = {"inc": "artists+releases+release-groups+tags+genres+isrcs+media"}
+
+        data = self._get(path, params=params)
+
         # Parseo del JSON hacia el modelo MBRecording
         title = data.get("title", "")
         # length viene en ms
         length = data.get("length")
 
         # Artistas
-        artists_data = data.get("artist-credit") or []
-        artists = []
-        for credit in artists_data:
-            artist_dict = credit.get("artist")
-            if artist_dict:
-                a_id = artist_dict.get("id")
-                a_name = artist_dict.get("name")
-                a_sort = artist_dict.get("sort-name")
-                artists.append(MBArtist(id=a_id, name=a_name, sort_name=a_sort))
+        mb_artist = MBArtist
+        artists = [
+            mb_artist(id=a.get("id"), name=a.get("name"), sort_name=a.get("sort-name"))
+            for a in (credit.get("artist") for credit in data.get("artist-credit") or [])
+            if a
+        ]
 
         # Releases
-        releases_data = data.get("releases") or []
-        releases = []
-        for rel in releases_data:
-            r_id = rel.get("id")
-            r_title = rel.get("title")
-            r_date = rel.get("date")  # "YYYY-MM-DD" o "YYYY"
-            r_country = rel.get("country")
-            r_status = rel.get("status")
-            
-            rg = rel.get("release-group") or {}
-            rg_id = rg.get("id")
-            rg_type = rg.get("primary-type")
-            
-            # Media Formats
-            media_list = rel.get("media") or []
-            formats = [m.get("format") for m in media_list if m.get("format")]
-
-            releases.append(
-                MBRelease(
-                    id=r_id,
-                    title=r_title,
-                    date=r_date,
-                    country=r_country,
-                    status=r_status,
-                    release_group_id=rg_id,
-                    release_group_type=rg_type,
-                    media_formats=formats
-                )
-            )
+        releases = [_parse_release(rel) for rel in data.get("releases") or []]
 
         # Parse tags/genres
-        tag_list = []
         raw_tags = data.get("tags") or []
         raw_genres = data.get("genres") or []
         
@@ -171,12 +223,9 @@ class MusicBrainzClient:
         # Sort by count desc if available (higher count = more relevant)
         all_tags.sort(key=lambda x: x.get("count", 0), reverse=True)
         
-        seen_tags = set()
-        for t in all_tags:
-            name = t.get("name")
-            if name and name not in seen_tags:
-                tag_list.append(name.title()) # Capitalize like "House", "Techno"
-                seen_tags.add(name)
+        # Dedupe preservando orden (dict mantiene el orden de inserción)
+        names = dict.fromkeys(t["name"] for t in all_tags if t.get("name"))
+        tag_list = [n.title() for n in names] # Capitalize like "House", "Techno"
         
         return MBRecording(
             id=data.get("id"),
@@ -1,9 +1,12 @@
 import logging
 import requests
 import base64
+import threading
 import time
 from typing import List, Optional, Dict, Any
 from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from mp3_autotagger.config import SPOTIFY_CLIENT_ID, SPOTIFY_CLIENT_SECRET
 from mp3_autotagger.core.models import Track
@@ -19,12 +22,25 @@ class SpotifyClient:
     
     TOKEN_URL = "https://accounts.spotify.com/api/token"
     API_BASE_URL = "https://api.spotify.com/v1"
+    # Máximo de búsquedas simultáneas: el pool de red del manager puede ser
+    # mucho más ancho que lo que la API de Spotify tolera sin devolver 429.
+    MAX_CONCURRENT_REQUESTS = 4
 
     def __init__(self):
         self.client_id = SPOTIFY_CLIENT_ID
         self.client_secret = SPOTIFY_CLIENT_SECRET
         self.access_token = None
         self.token_expiry = 0
+        self._slots = threading.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        # Sesión persistente: token y búsquedas reutilizan la conexión TLS.
+        # Reintenta solo fallos de conexión y 5xx transitorios (los 429 se
+        # siguen reportando tal cual, como antes).
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=self.MAX_CONCURRENT_REQUESTS,
+                              pool_maxsize=self.MAX_CONCURRENT_REQUESTS, max_retries=retry)
+        self.session.mount("https://", adapter)
         
         if not self.client_id or not self.client_secret:
             logger.warning("Spotify credentials not found (SPOTIFY_CLIENT_ID/SECRET).")
@@ -47,7 +63,7 @@ class SpotifyClient:
             }
             data = {"grant_type": "client_credentials"}
             
-            resp = requests.post(self.TOKEN_URL, headers=headers, data=data, timeout=10)
+            resp = self.session.post(self.TOKEN_URL, headers=headers, data=data, timeout=10)
             if resp.status_code == 200:
                 json_data = resp.json()
                 self.access_token = json_data["access_token"]
@@ -90,7 +106,8 @@ class SpotifyClient:
         }
 
         try:
-            resp = requests.get(f"{self.API_BASE_URL}/search", headers=headers, params=params, timeout=10)
+            with self._slots:
+                resp = self.session.get(f"{self.API_BASE_URL}/search", headers=headers, params=params, timeout=10)
             if resp.status_code != 200:
                 logger.warning(f"Spotify Search Error: {resp.status_code}")
                 return []
@@ -130,7 +147,8 @@ class SpotifyClient:
         }
 
         try:
-            resp = requests.get(f"{self.API_BASE_URL}/search", headers=headers, params=params, timeout=10)
+            with self._slots:
+                resp = self.session.get(f"{self.API_BASE_URL}/search", headers=headers, params=params, timeout=10)
             if resp.status_code != 200:
                 logger.warning(f"Spotify Broad Search Error: {resp.status_code}")
                 return []
@@ -1,5 +1,6 @@
 from dotenv import load_dotenv
 import os
+import sys
 
 # Cargar variables desde .env en la raíz del proyecto
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -26,4 +27,12 @@ COMPILATION_KEYWORDS = [
 ]
 
 CONFIDENCE_THRESHOLD_HIGH = 0.90
-CONFIDENCE_THRESHOLD_MEDIUM = 0.70
\ No newline at end of file
+CONFIDENCE_THRESHOLD_MEDIUM = 0.70
+
+# Valores de relleno cuando falta un dato. Internados: cuando el valor lo asignó
+# el propio pipeline (mappers, fallback local), los == del QA resuelven por
+# identidad; si viene de tags o de un servicio externo se compara el texto.
+UNKNOWN_ARTIST = sys.intern("Unknown Artist")
+UNKNOWN_TITLE = sys.intern("Unknown Title")
+UNKNOWN_ALBUM = sys.intern("Unknown Album")
+DEFAULT_GENRE = sys.intern("Electronic")  # MusicBrainz casi nunca trae género
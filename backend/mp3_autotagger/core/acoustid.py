@@ -6,6 +6,11 @@ import acoustid
 from mutagen import File as MutagenFile
 
 from mp3_autotagger.config import ACOUSTID_API_KEY
+from mp3_autotagger.data_structures.schemas import TXXXKeys
+
+# IDs que el propio Tagger deja en TXXX; analyze_file los expone para que el
+# pipeline reconozca archivos ya etiquetados
+_LOCAL_ID_KEYS = (TXXXKeys.MB_TRACK_ID, TXXXKeys.DISCOGS_RELEASE_ID, TXXXKeys.SPOTIFY_ID)
 
 
 def analyze_file(path: str) -> Dict[str, Any]:
@@ -14,18 +19,29 @@ def analyze_file(path: str) -> Dict[str, Any]:
 
     Retorna un diccionario con:
       - duration: duración en segundos (float o None)
-      - tags: dict con algunos campos ID3 básicos (cuando existan)
+      - tags: dict con algunos campos ID3 básicos (cuando existan), más los
+        IDs TXXX de MusicBrainz / Discogs / Spotify indexados por su descripción
+      - cover: bytes de la primera portada APIC (o None), para no re-parsear el ID3 después
     """
     audio = MutagenFile(path)
     if not audio or not audio.info:
-        return {"duration": None, "tags": {}}
+        return {"duration": None, "tags": {}, "cover": None}
 
     duration = getattr(audio.info, "length", None)
 
     tags: Dict[str, Any] = {}
+    cover = None
     if audio.tags:
+        getall = getattr(audio.tags, "getall", None) # Solo ID3 expone frames APIC
+        if getall is not None:
+            apics = getall("APIC")
+            if apics:
+                cover = apics[0].data
+            for frame in getall("TXXX"):
+                if frame.desc in _LOCAL_ID_KEYS and frame.text:
+                    tags[frame.desc] = str(frame.text[0])
         # Campos ID3 típicos en MP3
-        for key in ("TIT2", "TPE1", "TALB", "TCON"):
+        for key in ("TIT2", "TPE1", "TALB", "TCON", "TDRC", "TPUB"):
             if key in audio.tags:
                 try:
                     tags[key] = str(audio.tags[key])
@@ -34,7 +50,7 @@ def analyze_file(path: str) -> Dict[str, Any]:
                         audio.tags[key]
                     )
 
-    return {"duration": duration, "tags": tags}
+    return {"duration": duration, "tags": tags, "cover": cover}
 
 
 def identify_with_acoustid(path: str) -> List[Dict[str, Any]]:
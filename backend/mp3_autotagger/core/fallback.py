@@ -1,11 +1,29 @@
 
 import os
 import re
+from functools import lru_cache
 from typing import Optional, Dict, List, Any
 from mutagen import File as MutagenFile
 from mp3_autotagger.clients.discogs import DiscogsClient, DiscogsClientError
 from mp3_autotagger.core.matching import _jaccard_similarity
 
+# Patrones precompilados (se usan en cada archivo procesado)
+_RE_NUM_PREFIX = re.compile(r"^\d+[\.\-]\s*") # "01. "
+_RE_KEY_BPM = re.compile(r"^\d+[A-Z]?\s-\s\d+\s-\s") # "1A - 128 - "
+_RE_Y2MATE = re.compile(r"^y2mate\.com\s-\s", re.IGNORECASE)
+_RE_KBPS = re.compile(r"(?:_320kbps|\(320\s?kbps\))", re.IGNORECASE)
+_RE_UNDERSCORE_DOT = re.compile(r"[_\.]")
+_RE_WS = re.compile(r"\s+")
+_DUR_RE = re.compile(r"^(?:(\d+):)?(\d+):(\d+)$") # "M:SS" o "H:MM:SS"
+_RE_PAREN = re.compile(r"\(.*?\)")
+_RE_BRACK = re.compile(r"\[.*?\]")
+_RE_MIX_WORDS = re.compile(
+    r"\b(original|extended|club|remix|mix|edit|vocal|dub|feat|ft|featuring)\b", re.IGNORECASE
+)
+_RE_REMIX_WORDS = re.compile(
+    r"\b(original|extended|club|remix|mix|edit|vocal|dub|feat|ft|featuring|presents|pres)\b", re.IGNORECASE
+)
+
 def clean_filename(filename: str) -> str:
     """
     Limpia un nombre de archivo para maximizar la probabilidad de encontrar
@@ -15,32 +33,33 @@ def clean_filename(filename: str) -> str:
     name = os.path.splitext(filename)[0]
     
     # 2. Quitar patrones comunes de "ruido"
-    name = re.sub(r"^\d+[\.\-]\s*", "", name) # "01. "
-    name = re.sub(r"^\d+[A-Z]?\s-\s\d+\s-\s", "", name) # "1A - 128 - "
-    name = re.sub(r"^y2mate\.com\s-\s", "", name, flags=re.IGNORECASE)
+    name = _RE_NUM_PREFIX.sub("", name) # "01. "
+    name = _RE_KEY_BPM.sub("", name) # "1A - 128 - "
+    name = _RE_Y2MATE.sub("", name)
     
-    # Quitar info técnica al final
-    name = re.sub(r"_320kbps", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"\(320\s?kbps\)", "", name, flags=re.IGNORECASE)
+    # Quitar info técnica al final ("_320kbps", "(320 kbps)")
+    name = _RE_KBPS.sub("", name)
     
     # 3. Reemplazar guiones bajos y puntos por espacios
-    name = re.sub(r"[_\.]", " ", name)
+    name = _RE_UNDERSCORE_DOT.sub(" ", name)
     
     # 4. Quitar espacios múltiples
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _RE_WS.sub(" ", name).strip()
     
     return name
 
+@lru_cache(maxsize=8192)
 def clean_title_aggressive(title: str) -> str:
     """Quita remix, mix, feat, parentesis, etc para busqueda agnostica."""
-    t = re.sub(r"\(.*?\)", "", title)
-    t = re.sub(r"\[.*?\]", "", t)
-    t = re.sub(r"\b(original|extended|club|remix|mix|edit|vocal|dub|feat|ft|featuring)\b", "", t, flags=re.IGNORECASE)
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _RE_PAREN.sub("", title)
+    t = _RE_BRACK.sub("", t)
+    t = _RE_MIX_WORDS.sub("", t)
+    t = _RE_WS.sub(" ", t).strip()
     return t
 
-def get_audio_duration(file_path: str) -> Optional[float]:
-    """Obtiene la duración en segundos del archivo usando mutagen."""
+@lru_cache(maxsize=2048)
+def _cached_duration(file_path: str, size: int, mtime_ns: int) -> Optional[float]:
+    # size/mtime forman parte de la clave: si el archivo cambia, se vuelve a leer
     try:
         audio = MutagenFile(file_path)
         if audio and audio.info and audio.info.length:
@@ -49,6 +68,14 @@ def get_audio_duration(file_path: str) -> Optional[float]:
         pass
     return None
 
+def get_audio_duration(file_path: str) -> Optional[float]:
+    """Obtiene la duración en segundos del archivo usando mutagen (cacheada por path+size+mtime)."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return _cached_duration(file_path, st.st_size, st.st_mtime_ns)
+
 def fallback_search_by_filename(
     file_path: str,
     discogs_client: DiscogsClient
@@ -70,10 +97,10 @@ def fallback_search_by_filename(
 
     # Estrategia de búsqueda: [Query Exacta, Query Relajada]
     # Calculamos relaxed_query
-    relaxed_query = re.sub(r"\((.*?)\)", "", clean_query) # Quitar parentesis
-    relaxed_query = re.sub(r"\[.*?\]", "", relaxed_query) # Quitar corchetes
-    relaxed_query = re.sub(r"\b(original|extended|club|remix|mix|edit|vocal|dub|feat|ft|featuring|presents|pres)\b", "", relaxed_query, flags=re.IGNORECASE)
-    relaxed_query = re.sub(r"\s+", " ", relaxed_query).strip()
+    relaxed_query = _RE_PAREN.sub("", clean_query) # Quitar parentesis
+    relaxed_query = _RE_BRACK.sub("", relaxed_query) # Quitar corchetes
+    relaxed_query = _RE_REMIX_WORDS.sub("", relaxed_query)
+    relaxed_query = _RE_WS.sub(" ", relaxed_query).strip()
     
     queries_to_try = [clean_query]
     if len(relaxed_query) > 3 and relaxed_query != clean_query:
@@ -95,21 +122,23 @@ def fallback_search_by_filename(
             )
             
             results = data.get("results") or []
-            
-            for cand in results:
-                if cand.get("type") != "release":
-                    continue
-                    
+
+            # Jaccard para validar titulo: puntuamos todo el lote una vez y
+            # recorremos de mayor a menor similitud, cortando al bajar del umbral.
+            # bajamos umbral a 0.15 para capturar matches difícles (ej. "Artist - Title" vs "Title")
+            threshold = 0.15 if is_relaxed else 0.25
+            scored = [
+                (_jaccard_similarity(query, cand.get("title", "")), cand)
+                for cand in results
+                if cand.get("type") == "release"
+            ]
+            scored.sort(key=lambda sc: sc[0], reverse=True)
+
+            for sim, cand in scored:
+                if sim < threshold:
+                    break
+
                 cand_title = cand.get("title", "")
-                
-                # Jaccard para validar titulo
-                # bajamos umbral a 0.15 para capturar matches difícles (ej. "Artist - Title" vs "Title")
-                threshold = 0.15 if is_relaxed else 0.25
-                sim = _jaccard_similarity(query, cand_title)
-                
-                if sim < threshold: 
-                    continue
-                    
                 cand_id = cand.get("id")
                 
                 # Obtener detalles para duración
@@ -124,36 +153,33 @@ def fallback_search_by_filename(
                     if not dur_str:
                         continue
                     
-                    try:
-                        parts = dur_str.split(":")
-                        if len(parts) == 2:
-                            cand_dur = int(parts[0]) * 60 + int(parts[1])
-                        elif len(parts) == 3: # H:M:S
-                             cand_dur = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-                            
-                        # Tolerancia 5s
-                        diff = abs(cand_dur - duration)
-                        
-                        if diff <= 5.0:
-                            print(f"  -> MATCH FALLBACK: {cand_title} // Track: {trk.get('title')} ({dur_str})")
-                            
-                            return {
-                                "fallback_source": "discogs_filename",
-                                "discogs_id": cand_id,
-                                "discogs_title": trk.get("title"),
-                                "discogs_artist": release_details.get("artists_sort") or cand.get("artist"),
-                                "discogs_album": release_details.get("title"),
-                                "discogs_year": release_details.get("year"),
-                                "discogs_genre": release_details.get("genres"),
-                                "discogs_styles": release_details.get("styles"),
-                                "discogs_cover": cand.get("cover_image") or cand.get("thumb"),
-                                "discogs_format": cand.get("format"),
-                                "discogs_label": (release_details.get("labels") or [{}])[0].get("name"),
-                                "discogs_country": release_details.get("country"),
-                                "discogs_release_url": release_details.get("uri"),
-                            }
-                    except Exception:
+                    m = _DUR_RE.match(dur_str)
+                    if not m:
                         continue
+                    h, mm, ss = m.groups()
+                    cand_dur = (int(h) if h else 0) * 3600 + int(mm) * 60 + int(ss)
+
+                    # Tolerancia 5s
+                    diff = abs(cand_dur - duration)
+                    
+                    if diff <= 5.0:
+                        print(f"  -> MATCH FALLBACK: {cand_title} // Track: {trk.get('title')} ({dur_str})")
+                        
+                        return {
+                            "fallback_source": "discogs_filename",
+                            "discogs_id": cand_id,
+                            "discogs_title": trk.get("title"),
+                            "discogs_artist": release_details.get("artists_sort") or cand.get("artist"),
+                            "discogs_album": release_details.get("title"),
+                            "discogs_year": release_details.get("year"),
+                            "discogs_genre": release_details.get("genres"),
+                            "discogs_styles": release_details.get("styles"),
+                            "discogs_cover": cand.get("cover_image") or cand.get("thumb"),
+                            "discogs_format": cand.get("format"),
+                            "discogs_label": (release_details.get("labels") or [{}])[0].get("name"),
+                            "discogs_country": release_details.get("country"),
+                            "discogs_release_url": release_details.get("uri"),
+                        }
         except DiscogsClientError as e:
             print(f"[Fallback] Error Discogs API: {e}")
             break
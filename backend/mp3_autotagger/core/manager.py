@@ -3,11 +3,13 @@ from __future__ import annotations
 import os
 import shutil
 import logging
-from typing import List, Optional
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from functools import lru_cache, partial
+from typing import Dict, Iterator, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
 import csv
 import hashlib
-from mutagen.id3 import ID3, APIC
+from mutagen.id3 import ID3
 from datetime import datetime
 
 from .pipeline import PipelineCore
@@ -16,6 +18,108 @@ from mp3_autotagger.core.models import TrackMetadataBase
 
 logger = logging.getLogger(__name__)
 
+# Todas las variantes de mayúsculas de ".mp3": endswith(tuple) no crea strings nuevos
+_MP3_SUFFIXES = ('.mp3', '.mP3', '.Mp3', '.MP3')
+
+# Caracteres no válidos en nombres de archivo (Windows), para el renombrado.
+# Tabla de translate: se eliminan en una sola pasada en C, sin motor de regex.
+_FNAME_TRANS = str.maketrans('', '', '<>:"/\\|?*')
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """
+    Copia src -> dst preservando metadatos (equivalente a shutil.copy2).
+    Usa os.copy_file_range cuando existe: en el mismo filesystem lo resuelve el
+    kernel (reflink en XFS/Btrfs), sin pasar los datos por espacio de usuario.
+    """
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+                copied = remaining <= 0
+        except OSError:
+            # EXDEV/ENOSYS/EINVAL (otro filesystem, kernel antiguo, FS sin soporte)
+            copied = False
+    if not copied:
+        # shutil ya usa sendfile en Linux y fcopyfile en macOS
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+def _list_dir(path: str):
+    """
+    Lista un directorio con scandir: devuelve (mp3s, subdirectorios), ambos ordenados.
+    DirEntry ya trae el tipo de archivo, sin stat() extra por entrada.
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(_MP3_SUFFIXES):
+                        files.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        # Igual que os.walk: directorios ilegibles se ignoran
+        pass
+    files.sort()
+    subdirs.sort()
+    return files, subdirs
+
+
+@lru_cache(maxsize=16384)
+def _cover_cache_name(file_path: str) -> str:
+    """
+    Nombre del archivo de portada en caché para file_path (blake2b-128 del path).
+    Memoizado: re-escanear la misma biblioteca no vuelve a codificar ni hashear.
+    """
+    return hashlib.blake2b(file_path.encode('utf-8'), digest_size=16).hexdigest() + ".jpg"
+
+
+def _final_confidence(result) -> float:
+    """Confianza del match (0-1): la del track y, si no hay, la de Discogs."""
+    conf = result.track_metadata.match_confidence
+    if not conf and result.discogs_result and result.discogs_result.discogs_confidence_score:
+        conf = result.discogs_result.discogs_confidence_score
+    return conf or 0.0
+
+
+def _final_confidence_pct(result) -> float:
+    """Igual que _final_confidence pero en porcentaje, como la muestra la UI."""
+    conf = _final_confidence(result)
+    # Convert to percentage if it's 0-1
+    return conf * 100 if conf <= 1.0 else conf
+
+
+# Columnas del reporte CSV de escaneo (status lo calcula _csv_status, el resto viene del dict de la UI)
+_CSV_FIELDS = (
+    "status", "filename", "original_filename",
+    "artist", "title", "album", "year",
+    "genre", "styles", "publisher", "cat_number",
+    "country", "format", "release_type", "release_status",
+    "isrc", "duration_str", "duration_diff", "confidence", "source",
+    "url_spotify", "url_discogs", "mb_track_id", "mb_release_id", "acoustid",
+)
+
+
+def _csv_status(row: dict) -> str:
+    """Estado de la fila para el CSV según confianza/rescate (la UI lo calcula aparte)."""
+    if row.get("confidence", 0) < 50:
+        return "REJECTED"
+    if row.get("rescued"):
+        return "RESCUED"
+    return "READY"
+
+
 class LibraryManager:
     """
     Gestor principal de la biblioteca.
@@ -26,59 +130,105 @@ class LibraryManager:
     4. Orquestar el etiquetado (Pipeline + Tagger).
     """
 
-    def __init__(self, use_discogs: bool = True, dry_run: bool = False, progress_callback=None):
+    # Workers de la etapa de disco (copia + escritura de tags)
+    IO_WORKERS = 4
+    # Workers para extraer portadas (APIC) mientras la identificación espera a la red
+    COVER_WORKERS = 4
+    # Workers de apply_batch (etiquetado + renombrado/movido de los archivos revisados)
+    APPLY_WORKERS = 8
+    # Hilos para listar directorios durante el escaneo
+    SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
+    def __init__(self, use_discogs: bool = True, dry_run: bool = False, progress_callback=None, workers: int | None = None,
+                 force_refetch: bool = False):
         self.use_discogs = use_discogs
         self.dry_run = dry_run # If true, we simulate changes and generate a report
         self.progress_callback = progress_callback
+        # Workers de la etapa de red (pipeline). Casi todo el tiempo esperan sockets,
+        # así que el pool puede ser ancho; los rate limits los aplica cada cliente.
+        self.workers = workers or min(32, (os.cpu_count() or 4) * 5)
         
         # Componentes
-        self.pipeline = PipelineCore(use_discogs=use_discogs)
+        self.pipeline = PipelineCore(use_discogs=use_discogs, force_refetch=force_refetch)
         self.tagger = Tagger(dry_run=dry_run)
+        # apply_batch siempre escribe de verdad (el usuario ya revisó en la UI).
+        # Tagger no guarda estado, así que una instancia se comparte entre los workers.
+        self._apply_tagger = self.tagger if not dry_run else Tagger(dry_run=False)
         self.library_path = "" # Added
         self.scan_results = [] # Modified from last_scan_results
-        self.last_results_map = {} # Map index -> Result object # Added
         
         # Cache Config # Added
         self.base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__))) # Added
         self.cover_cache_dir = os.path.join(self.base_dir, "cache", "covers") # Added
         os.makedirs(self.cover_cache_dir, exist_ok=True) # Added
+        # Índice en memoria del caché de portadas: un solo scandir en vez de un stat por archivo
+        self._cover_cache_lock = threading.Lock()
+        with os.scandir(self.cover_cache_dir) as it:
+            self._cover_cache_index = {e.name for e in it}
         
-        # Estadísticas
-        self.stats = {
-            "processed": 0,
-            "success": 0, # Modified from matched
-            "rescued": 0, # Added
-            "failed": 0
-        }
+        # Estadísticas (actualizadas desde callbacks de los workers, bajo lock)
+        self._stats_lock = threading.Lock()
+        # Contadores planos: cada callback hace un += sobre un atributo, sin lookups de dict
+        self._processed = 0
+        self._success = 0
+        self._rescued = 0
+        self._failed = 0
 
         # Custom Rename Format (Phase 4)
         self.rename_pattern = "{artist} - {title}"
 
         self.last_scan_results = [] # Store results for UI interaction
+        self._created_dirs = set() # Carpetas destino ya creadas en esta ejecución
+        self._rename_lock = threading.Lock()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot de las estadísticas para la UI / resumen.
+        "matched" se mantiene como alias de "success" (lo lee server.py).
+        """
+        return {
+            "processed": self._processed,
+            "success": self._success,
+            "matched": self._success,
+            "rescued": self._rescued,
+            "failed": self._failed,
+        }
 
-    def _get_cover_art(self, file_path: str) -> str:
+    def _get_cover_art(self, file_path: str, cover_bytes: Optional[bytes] = None) -> str:
         """
         Extracts embedded cover art (APIC) from MP3.
+        If cover_bytes is given (APIC already read by the pipeline), the ID3 is not parsed again.
         Returns absolute path to cached image, or empty string if none.
-        Uses md5 of file path as cache key.
+        Uses blake2b-128 of file path as cache key (no criptográfico, solo clave local).
         """
         try:
             # Cache Key
-            file_hash = hashlib.md5(file_path.encode('utf-8')).hexdigest()
-            cache_path = os.path.join(self.cover_cache_dir, f"{file_hash}.jpg")
+            cache_name = _cover_cache_name(file_path)
+            cache_path = os.path.join(self.cover_cache_dir, cache_name)
             
             # Return cached if exists
-            if os.path.exists(cache_path):
+            if cache_name in self._cover_cache_index:
                 return cache_path
             
             # Extract
-            audio = ID3(file_path)
-            for tag in audio.values():
-                if isinstance(tag, APIC):
-                    # Found art
-                    with open(cache_path, 'wb') as img:
-                        img.write(tag.data)
-                    return cache_path
+            if cover_bytes is None:
+                # getall indexa por tipo de frame: sin recorrer todos los TXXX/COMM
+                apics = ID3(file_path).getall("APIC")
+                if apics:
+                    cover_bytes = apics[0].data
+            if cover_bytes:
+                # Found art. O_EXCL: si otro worker ya creó la misma portada
+                # (archivos duplicados -> misma clave), no la reescribimos.
+                try:
+                    fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                    with os.fdopen(fd, 'wb') as img:
+                        img.write(cover_bytes)
+                except FileExistsError:
+                    pass
+                with self._cover_cache_lock:
+                    self._cover_cache_index.add(cache_name)
+                return cache_path
                     
         except Exception as e:
             # logger.warning(f"Error extracting art for {os.path.basename(file_path)}: {e}")
@@ -102,71 +252,135 @@ class LibraryManager:
         self._notify(f"Verificando directorio: {input_dir}")
 
         if not os.path.exists(input_dir):
-            logger.error(f"El directorio de entrada no existe: {input_dir}")
+            logger.error("El directorio de entrada no existe: %s", input_dir)
             self._notify(f"ERROR: No existe directorio {input_dir}")
             return
 
-        logger.info(f"Iniciando procesamiento de biblioteca...")
+        logger.info("Iniciando procesamiento de biblioteca...")
         self._notify("Escanando archivos MP3...")
 
-        # Obtener lista de archivos MP3
-        files_to_process = self._scan_directory(input_dir)
-        total_files = len(files_to_process)
-        
-        if total_files == 0:
-            logger.warning("No se encontraron archivos MP3 en el directorio de origen.")
-            self._notify("No se encontraron archivos MP3.")
-            return
-
-        logger.info(f"Se encontraron {total_files} archivos para procesar.")
-        self._notify(f"Encontrados {total_files} archivos. Iniciando workers...")
-
-        # Procesamiento Paralelo
-        # Usamos max_workers=4 para equilibrar velocidad vs rate limits
-        workers = 4
-        logger.info(f"Iniciando procesamiento paralelo con {workers} workers...")
+        # Cada worker escribe en su posición del escaneo, así el índice de la UI
+        # coincide con el de apply_batch sin importar el orden de llegada
+        if self.progress_callback:
+            # Pasada rápida que solo cuenta: la UI necesita el total por adelantado
+            total_files = sum(1 for _ in self._scan_directory(input_dir))
+            if total_files == 0:
+                self._warn_no_files()
+                return
+            logger.info("Se encontraron %s archivos para procesar.", total_files)
+            self.last_scan_results = [None] * total_files
+            self._notify(f"Encontrados {total_files} archivos. Iniciando workers...")
+        else:
+            # Sin UI no hace falta el total: se procesa mientras se recorre el árbol
+            # (un solo recorrido) y _collect_result va extendiendo last_scan_results
+            total_files = "?"
+
+        # Procesamiento Paralelo en dos etapas:
+        # - net_pool: identificación (AcoustID/MB/Spotify/Discogs), limitada por latencia de red
+        # - io_pool: copia + escritura de tags, pocos workers para no saturar el disco
+        workers = self.workers
+        # Tope de tareas en vuelo: el recorrido del árbol se solapa con el trabajo
+        # de red sin acumular un future por cada archivo de la biblioteca.
+        max_in_flight = workers * 2
+        logger.info("Iniciando procesamiento paralelo con %s workers de red y %s de disco...", workers, self.IO_WORKERS)
         
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            # Diccionario para mantener orden de logs si fuera necesario, 
-            # pero aquí priorizamos la ejecución.
-            # Mapeamos future -> (index, rel_path, src, dest)
-            futures = {}
-            for i, src_path in enumerate(files_to_process, 1):
-                rel_path = os.path.relpath(src_path, input_dir)
-                dest_path = os.path.join(output_dir, rel_path)
+        prefix_len = len(os.path.join(input_dir, ""))
+        self._created_dirs = set()
+
+        # Las portadas solo se usan en los detalles de la UI: sin callback no se extraen
+        with ThreadPoolExecutor(max_workers=workers) as net_pool, \
+             ThreadPoolExecutor(max_workers=self.IO_WORKERS) as io_pool, \
+             ThreadPoolExecutor(max_workers=self.COVER_WORKERS, thread_name_prefix="cover") as cover_pool:
+            if not self.progress_callback:
+                cover_pool = None
+            in_flight = set()
+            scanned = 0
+            for i, src_path in enumerate(self._scan_directory(input_dir), 1):
+                scanned = i
+                # src_path siempre cuelga de input_dir (viene de scandir): basta con cortar el prefijo
+                dest_path = os.path.join(output_dir, src_path[prefix_len:])
                 
-                # Enviamos tarea
-                fut = executor.submit(self._process_single_file_safe, src_path, dest_path, i, total_files)
-                futures[fut] = (i, rel_path) # Store index (1-based) to order logically if needed
-            
-            # Procesar resultados conforme llegan
-            from concurrent.futures import as_completed
-            
-            # Pre-fill list with None to allow index-based insertion? 
-            # Or just append. Appending is easier but order is random.
-            # UI expects specific order? Table rows match log order usually.
-            # Let's assume UI handles mapping via an ID or Index we provide.
+                # Enviamos tarea; el callback registra el resultado al terminar
+                fut = self._submit_file(net_pool, io_pool, cover_pool, src_path, dest_path, i, total_files)
+                fut.add_done_callback(partial(self._collect_result, i - 1))
+                in_flight.add(fut)
+                
+                if len(in_flight) >= max_in_flight:
+                    _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
             
-            for future in as_completed(futures):
-                try:
-                    res_tuple = future.result()
-                    # Unpack: (run_ok, is_match, result_object)
-                    # We need to change _process_single_file_safe signature to return result object too
-                    run_ok, is_match, res_obj = res_tuple
-                    
-                    if run_ok:
-                         self.last_scan_results.append(res_obj) # Add to storage
-                         self.stats["processed"] += 1
-                         if is_match:
-                             self.stats["success"] += 1
-                    else:
-                         self.stats["failed"] += 1
-                except Exception as e:
-                    logger.error(f"Error en worker: {e}")
-                    self.stats["failed"] += 1
+            # Esperar a los que quedan
+            wait(in_flight)
 
+        if not self.progress_callback:
+            if scanned == 0:
+                self._warn_no_files()
+                return
+            logger.info("Se procesaron %s archivos.", scanned)
         self._print_summary()
+
+    def _warn_no_files(self) -> None:
+        logger.warning("No se encontraron archivos MP3 en el directorio de origen.")
+        self._notify("No se encontraron archivos MP3.")
         
+    def _submit_file(self, net_pool, io_pool, cover_pool, src, dest, idx, total) -> Future:
+        """
+        Encadena las dos etapas de un archivo: al terminar la identificación en
+        net_pool se encola la copia/etiquetado en io_pool.
+        Si hay cover_pool, la portada (el APIC que ya leyó el pipeline) se guarda
+        en caché allí, en paralelo con la copia/etiquetado.
+        Devuelve un Future con el mismo resultado que _process_single_file_safe.
+        """
+        done = Future()
+
+        def relay(io_fut):
+            exc = io_fut.exception()
+            if exc is not None:
+                done.set_exception(exc)
+            else:
+                done.set_result(io_fut.result())
+
+        def start_io_stage(net_fut):
+            # concurrent.futures solo loguea las excepciones de un done-callback:
+            # si algo falla aquí, `done` debe resolverse igual o wait() no termina
+            try:
+                cover = None
+                if cover_pool is not None and net_fut.exception() is None:
+                    res = net_fut.result()
+                    if res is not None and res.local_cover_bytes:
+                        cover = cover_pool.submit(self._get_cover_art, src, res.local_cover_bytes)
+                io_pool.submit(self._process_single_file_safe, src, dest, idx, total, net_fut, cover).add_done_callback(relay)
+            except BaseException as exc:
+                done.set_exception(exc)
+
+        net_pool.submit(self.pipeline.process_file, src).add_done_callback(start_io_stage)
+        return done
+
+    def _collect_result(self, pos: int, future) -> None:
+        """
+        Done-callback: registra el resultado de un worker en last_scan_results[pos] y stats.
+        Corre en el hilo del worker, por eso todo se actualiza bajo _stats_lock.
+        """
+        try:
+            # Unpack: (run_ok, is_match, result_object)
+            run_ok, is_match, res_obj = future.result()
+        except Exception as e:
+            logger.error("Error en worker: %s", e)
+            with self._stats_lock:
+                self._failed += 1
+            return
+
+        with self._stats_lock:
+            if run_ok:
+                 if pos >= len(self.last_scan_results):
+                     # Sin conteo previo (sin UI), o archivo aparecido entre el conteo y el recorrido
+                     self.last_scan_results.extend([None] * (pos + 1 - len(self.last_scan_results)))
+                 self.last_scan_results[pos] = res_obj
+                 self._processed += 1
+                 if is_match:
+                     self._success += 1
+            else:
+                 self._failed += 1
+
     def apply_batch(self, indices: List[int]) -> int:
         """
         [Phase 4 + 6] 
@@ -177,105 +391,114 @@ class LibraryManager:
             logger.warning("No hay resultados de escaneo previos para aplicar.")
             return 0
             
-        logger.info(f"Procesando lote: {len(indices)} aprobados vs {len(self.last_scan_results) - len(indices)} rechazados.")
-        
-        success_count = 0
-        real_tagger = Tagger(dry_run=False)
+        approved = set(indices) # Membresía O(1) dentro del bucle
+        logger.info("Procesando lote: %s aprobados vs %s rechazados.", len(approved), len(self.last_scan_results) - len(approved))
         
         # Prepare RAW directory (Isolation)
         raw_dir = None
         try:
              # Infer base directory from first file
-             first_file = self.last_scan_results[0].track_metadata.filepath_original
+             first = next(r for r in self.last_scan_results if r)
+             first_file = first.track_metadata.filepath_original
              base_dir = os.path.dirname(first_file)
              folder_name = os.path.basename(base_dir)
              raw_dir = os.path.join(base_dir, f"{folder_name} - RAW")
         except Exception:
              pass
 
-        for idx, result in enumerate(self.last_scan_results):
-            if not result: continue
-            
-            meta = result.track_metadata
-            current_path = meta.filepath_original
-            
-            # --- APPROVED TRACKS ---
-            if idx in indices:
-                try:
-                    # 1. Write Tags
-                    ok = real_tagger.write_metadata(meta)
-                    if ok:
-                        # 2. Rename (Title - Artist.mp3)
-                        self._rename_optimized(meta)
-                        success_count += 1
-                except Exception as e:
-                    logger.error(f"Error procesando {getattr(meta, 'title', 'Unknown')}: {e}")
-            
-            # --- REJECTED TRACKS (Isolation) ---
-            else:
-                 if raw_dir:
-                     self._isolate_file(current_path, raw_dir)
-
-        logger.info(f"Cambios aplicados. Exitosos: {success_count}. El resto se movió a RAW.")
+        has_rejected = any(r for i, r in enumerate(self.last_scan_results) if i not in approved)
+        if raw_dir and has_rejected:
+            # Una sola vez por lote, no por cada archivo rechazado
+            try:
+                os.makedirs(raw_dir, exist_ok=True)
+            except OSError as e:
+                logger.warning("No se pudo crear la carpeta RAW %s: %s", raw_dir, e)
+                raw_dir = None
+
+        # Renombrar/mover/etiquetar son syscalls independientes por archivo: pool pequeño
+        with ThreadPoolExecutor(max_workers=self.APPLY_WORKERS) as pool:
+            futures = [
+                pool.submit(self._apply_one, result, idx in approved, raw_dir, self._apply_tagger)
+                for idx, result in enumerate(self.last_scan_results)
+                if result
+            ]
+            success_count = sum(f.result() for f in futures)
+
+        logger.info("Cambios aplicados. Exitosos: %s. El resto se movió a RAW.", success_count)
         return success_count
 
+    def _apply_one(self, result, is_approved: bool, raw_dir: Optional[str], tagger: Tagger) -> int:
+        """Aplica la decisión de la UI a un archivo. Devuelve 1 si se etiquetó y renombró."""
+        meta = result.track_metadata
+        
+        # --- APPROVED TRACKS ---
+        if is_approved:
+            try:
+                # 1. Write Tags
+                ok = tagger.write_metadata(meta)
+                if ok:
+                    # 2. Rename (Title - Artist.mp3)
+                    self._rename_optimized(meta)
+                    return 1
+            except Exception as e:
+                logger.error("Error procesando %s: %s", getattr(meta, 'title', 'Unknown'), e)
+        
+        # --- REJECTED TRACKS (Isolation) ---
+        elif raw_dir:
+            self._isolate_file(meta.filepath_original, raw_dir)
+        return 0
+
     def _rename_optimized(self, meta):
         """Renames file to 'Title - Artist.mp3'."""
         try:
             # Sanitize
-            import re
-            def clean(s): return re.sub(r'[<>:"/\\|?*]', '', str(s)).strip()
+            def clean(s): return str(s).translate(_FNAME_TRANS).strip()
             
             title = clean(meta.title)
             artist = clean(meta.artist_main)
             
             if not title or not artist: 
-                logger.warning(f"Rename skipped: Missing title='{title}' or artist='{artist}'")
+                logger.warning("Rename skipped: Missing title='%s' or artist='%s'", title, artist)
                 return
             
             new_name = f"{title} - {artist}.mp3"
             dir_path = os.path.dirname(meta.filepath_original)
             new_path = os.path.join(dir_path, new_name)
             
-            logger.info(f"Renaming '{meta.filepath_original}' -> '{new_path}'")
+            logger.info("Renaming '%s' -> '%s'", meta.filepath_original, new_path)
             
-            if new_path != meta.filepath_original and not os.path.exists(new_path):
-                os.rename(meta.filepath_original, new_path)
-                meta.filepath_original = new_path 
-            elif os.path.exists(new_path):
-                logger.warning(f"Rename skipped: Target exists '{new_name}'")
+            # Bajo lock: dos tracks aprobados con el mismo "Title - Artist" podrían pasar
+            # ambos el exists() y os.rename sobrescribiría al primero sin avisar
+            with self._rename_lock:
+                if new_path != meta.filepath_original and not os.path.exists(new_path):
+                    os.rename(meta.filepath_original, new_path)
+                    meta.filepath_original = new_path 
+                elif os.path.exists(new_path):
+                    logger.warning("Rename skipped: Target exists '%s'", new_name)
         except Exception as e:
-            logger.warning(f"Rename failed: {e}")
+            logger.warning("Rename failed: %s", e)
 
     def _isolate_file(self, src_path, raw_dir):
         """Moves file to RAW folder."""
         try:
-            if not os.path.exists(raw_dir):
-                os.makedirs(raw_dir, exist_ok=True)
-                
+            # raw_dir ya lo crea apply_batch antes de repartir el lote
             fname = os.path.basename(src_path)
             dest_path = os.path.join(raw_dir, fname)
             
-            logger.info(f"Isolating Rejected: {fname}")
+            logger.info("Isolating Rejected: %s", fname)
             
             # Avoid overwrite if possible, or overwrite if requested. 
             # Moving...
             if os.path.exists(src_path):
                 shutil.move(src_path, dest_path)
         except Exception as e:
-            logger.warning(f"Isolation failed for {src_path}: {e}")
-
-    def _print_summary(self) -> None:
-        logger.info("=== Resumen de Procesamiento ===")
-        logger.info(f"Total Procesados: {self.stats['processed']}")
-        logger.info(f"Exitosos (Match): {self.stats['matched']}")
-        logger.info(f"Fallidos (Error): {self.stats['failed']}")
-        logger.info("================================")
+            logger.warning("Isolation failed for %s: %s", src_path, e)
 
-    def _process_single_file_safe(self, src, dest, idx, total) -> tuple[bool, bool, Optional[object]]:
+    def _process_single_file_safe(self, src, dest, idx, total, identified: Optional[Future] = None,
+                                  cover: Optional[Future] = None) -> tuple[bool, bool, Optional[object]]:
         """Wrapper thread-safe. Return (run_success, is_matched, result_object)."""
         try:
-            result_obj = self._process_single_file(src, dest)
+            result_obj = self._process_single_file(src, dest, identified)
             is_match = result_obj is not None
             
             # Notificar progreso si hay callback
@@ -287,45 +510,32 @@ class LibraryManager:
                  # Extract details for UI
                  details = {}
                  if is_match:
-                     # Confidence logic: Try track_meta first, then discogs
-                     conf = getattr(result_obj.track_metadata, "match_confidence", 0.0)
-                     if not conf and result_obj.discogs_result:
-                         conf = result_obj.discogs_result.discogs_confidence_score
-                     
-                     # Store in list for UI access (Thread-safe append?)
-                     # List append is atomic in CPython, should be fine for now.
-                     # We rely on 'details' having an 'index' to map back if order meshes up,
-                     # but scan_results order in main depends on callback. 
-                     # Better: use the index passed to callback? No, idx comes from enumerate.
-                     # We need to store standard result in self.last_scan_results
-                     # BUT wait, this is running in thread. 
-                     # self.last_scan_results is global in manager instance.
-                     # We should resize list first or use a dict if random access needed.
-                     # Let's use a dict self.last_results_map = {idx: result} then convert to list.
-                     pass 
-
-                     # Convert to percentage if it's 0-1
-                     if conf <= 1.0: conf *= 100
-                         
+                     # Confidence logic: Try track_meta first, then discogs (en %)
+                     conf = _final_confidence_pct(result_obj)
+
                      # Pre-calculate durations
                      local_dur = 0.0
                      local_dur_str = "--:--"
                      diff = 0.0
                      
-                     try:
-                        from mutagen import File
-                        f = File(src)
-                        if f and f.info and f.info.length:
-                             local_dur = f.info.length
-                             local_dur_str = f"{int(local_dur/60)}:{int(local_dur%60):02d}"
-                             
-                             # Calculate Diff
-                             matched_dur_ms = result_obj.track_metadata.audio.duration_ms
-                             if matched_dur_ms:
-                                 matched_dur = matched_dur_ms / 1000.0
-                                 diff = round(local_dur - matched_dur, 2)
-                     except:
-                         pass
+                     # La duración local ya la leyó el pipeline: no reabrimos el MP3
+                     if result_obj.local_duration_sec:
+                         local_dur = result_obj.local_duration_sec
+                         local_dur_str = f"{int(local_dur/60)}:{int(local_dur%60):02d}"
+                         
+                         # Calculate Diff
+                         matched_dur_ms = result_obj.track_metadata.audio.duration_ms
+                         if matched_dur_ms:
+                             matched_dur = matched_dur_ms / 1000.0
+                             diff = round(local_dur - matched_dur, 2)
+
+                     # Portada: la guarda el cover_pool con el APIC que ya leyó el pipeline
+                     if cover is not None:
+                         cover_path = cover.result()
+                     elif result_obj.local_cover_bytes:
+                         cover_path = self._get_cover_art(src, result_obj.local_cover_bytes)
+                     else:
+                         cover_path = ""
 
                      # Extract Editorial & IDs
                      tm = result_obj.track_metadata
@@ -333,6 +543,9 @@ class LibraryManager:
                      ids = tm.ids
                      
                      details = {
+                         # Posición en last_scan_results (la que espera apply_batch)
+                         "index": idx - 1,
+
                          # Basic
                          "filename": os.path.basename(src), 
                          "original_filename": os.path.basename(src), 
@@ -354,7 +567,7 @@ class LibraryManager:
                          # "copyright":  # Not in standard model yet? Check schema logic or use publisher as proxy
                          "credits": "", # Placeholder. Need rich credits string
                          
-                         "cover_path": self._get_cover_art(src),
+                         "cover_path": cover_path,
                          
                          # IDs & URLs
                          "mb_track_id": ids.musicbrainz_track_id or "",
@@ -365,7 +578,7 @@ class LibraryManager:
 
                          # Logic
                          "confidence": conf,
-                         "source": "Spotify" if result_obj.spotify_used else ("Discogs" if result_obj.discogs_result else "MusicBrainz"),
+                         "source": "Local" if result_obj.local_only else ("Spotify" if result_obj.spotify_used else ("Discogs" if result_obj.discogs_result else "MusicBrainz")),
                          "duration_str": local_dur_str, 
                          "duration_diff": diff, 
                          "rescued": False 
@@ -373,51 +586,96 @@ class LibraryManager:
                      
                      self.progress_callback(msg, idx, total, self.stats, details)
 
+            if not is_match and cover is not None:
+                cover.cancel() # Sin match no hay fila en la UI
+            if result_obj is not None:
+                # Los resultados quedan en last_scan_results: no retener la imagen
+                result_obj.local_cover_bytes = None
             return True, is_match, result_obj
         except Exception as e:
-            logger.error(f"[{idx}/{total}] Fallo en {os.path.basename(src)}: {e}")
+            logger.error("[%s/%s] Fallo en %s: %s", idx, total, os.path.basename(src), e)
             return False, False, None
 
-    def _scan_directory(self, path: str) -> List[str]:
-        """Busca archivos MP3 recursivamente."""
-        mp3_files = []
-        for root, _, filenames in os.walk(path):
-            for filename in filenames:
-                if filename.lower().endswith('.mp3'):
-                    mp3_files.append(os.path.join(root, filename))
-        return sorted(mp3_files)
+    def _scan_directory(self, path: str) -> Iterator[str]:
+        """
+        Busca archivos MP3 recursivamente (generador).
+        Cada directorio se recorre en orden alfabético, así el orden es estable
+        sin tener que materializar y ordenar la lista completa.
+        """
+        # Recorrido en profundidad con lectura anticipada: los listados de los
+        # subdirectorios se piden a un pool en cuanto se descubren, así en discos
+        # de red las lecturas de directorio se solapan, pero el orden de salida
+        # sigue siendo el mismo que el del recorrido secuencial.
+        pool = ThreadPoolExecutor(max_workers=self.SCAN_WORKERS)
+        try:
+            stack = [pool.submit(_list_dir, path)]
+            while stack:
+                files, subdirs = stack.pop().result()
+                yield from files
+                # Se piden en orden (el primero en visitarse llega antes) y se
+                # apilan al revés: la pila es LIFO
+                pending = [pool.submit(_list_dir, d) for d in subdirs]
+                pending.reverse()
+                stack.extend(pending)
+        finally:
+            # Si el consumidor corta el generador, no seguir listando
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _is_same_file_copy(src_path: str, dest_path: str) -> bool:
+        """
+        True si dest ya es una copia de src: mismo mtime, como lo deja copystat.
+        No se compara el tamaño: al etiquetar dest cambia, pero _stamp_source_mtime
+        le devuelve el mtime del origen, así que el mtime identifica la versión de
+        src de la que salió la copia. En re-ejecuciones evita volver a copiar.
+        """
+        try:
+            s = os.stat(src_path)
+            d = os.stat(dest_path)
+        except OSError:
+            return False
+        return int(s.st_mtime) == int(d.st_mtime)
+
+    @staticmethod
+    def _stamp_source_mtime(src_path: str, dest_path: str) -> None:
+        """Tras escribir tags en dest, le devuelve el mtime de src (ver _is_same_file_copy)."""
+        try:
+            d = os.stat(dest_path)
+            os.utime(dest_path, ns=(d.st_atime_ns, os.stat(src_path).st_mtime_ns))
+        except OSError as e:
+            logger.warning("No se pudo fijar el mtime de %s: %s", dest_path, e)
 
-    def _process_single_file(self, src_path: str, dest_path: str):
+    def _process_single_file(self, src_path: str, dest_path: str, identified: Optional[Future] = None):
         """
-        1. Copia archivo a destino (creando carpetas).
-        2. Ejecuta pipeline sobre el destino.
+        1. Ejecuta pipeline sobre el origen (o toma el resultado ya calculado en `identified`).
+        2. Copia archivo a destino (creando carpetas).
         3. Escribe tags.
         """
-        # 1. Preparar destino
+        # 1. Identificar (Pipeline)
+        # El pipeline solo lee el archivo, así que se analiza el SOURCE: la etapa de red
+        # puede correr antes (y en otro pool) que la copia.
+        if identified is not None:
+            result = identified.result()
+        else:
+            result = self.pipeline.process_file(src_path)
+
+        # 2. Preparar destino
+        # makedirs(exist_ok=True) ya es idempotente; el set evita repetir la llamada
+        # para cada archivo de una misma carpeta.
         dest_dir = os.path.dirname(dest_path)
-        if not os.path.exists(dest_dir):
-            if not self.dry_run:
-                os.makedirs(dest_dir, exist_ok=True)
-            else:
-                pass # logger.debug(f"[DryRun] Crearía directorio: {dest_dir}")
+        if not self.dry_run and dest_dir not in self._created_dirs:
+            os.makedirs(dest_dir, exist_ok=True)
+            self._created_dirs.add(dest_dir)
 
-        # 2. Copiar archivo (si no existe o si se fuerza overwrite - por ahora overwritamos soft si cambió tamaño)
+        # 3. Copiar archivo (si no existe o si se fuerza overwrite - por ahora overwritamos soft si cambió tamaño)
         # Para garantizar idempotencia simple, copiamos siempre si no es dry run
-        if not self.dry_run:
+        if not self.dry_run and not self._is_same_file_copy(src_path, dest_path):
             try:
-                shutil.copy2(src_path, dest_path)
+                _fast_copy(src_path, dest_path)
             except Exception as e:
-                logger.error(f"Error copiando archivo: {e}")
+                logger.error("Error copiando archivo: %s", e)
                 return
         
-        target_file = dest_path if not self.dry_run else src_path
-        
-        # 3. Identificar (Pipeline)
-        # Ojo: Si es dry-run, el pipeline analiza el SOURCE, pero Tagger simula escritura.
-        # Si es real, pipeline analiza DEST y Tagger escribe en DEST.
-        
-        result = self.pipeline.process_file(target_file)
-        
         tm = result.track_metadata
         # Check for meaningful match (MB ID, Discogs ID, or Spotify ID)
         has_match = (
@@ -428,25 +686,29 @@ class LibraryManager:
         )
             
         if not has_match:
-            logger.warning(f"  -> SIN COINCIDENCIA para: {os.path.basename(src_path)}")
+            logger.warning("  -> SIN COINCIDENCIA para: %s", os.path.basename(src_path))
             # Aún así ya se copió el archivo, así que queda el original en CLEAN (que es deseable, fallback manual)
             return None
 
         src_lbl = "Discogs" if result.discogs_result and result.discogs_result.discogs_title else "MusicBrainz"
         if result.spotify_used: src_lbl = "Spotify"
-        if result.spotify_used: src_lbl = "Spotify"
+        if result.local_only:
+            # Tags locales ya completos: la copia en destino ya los lleva, re-escribirlos
+            # solo podría alterarlos. El resultado igual debe apuntar a la copia:
+            # apply_batch renombra / aísla el archivo de filepath_original.
+            if not self.dry_run:
+                tm.filepath_original = dest_path
+            logger.info("  -> TAGS LOCALES: %s / %s", result.get_display_title(), result.get_display_artist())
+            return result
         
         # GUARDRAIL: Confidence Check (Phase 28 Optimization)
         # If match confidence is too low (e.g. < 50%), treat as NO MATCH to avoid bad tagging.
-        final_conf = tm.match_confidence
-        if final_conf == 0.0 and result.discogs_result and result.discogs_result.discogs_confidence_score:
-             final_conf = result.discogs_result.discogs_confidence_score
-
-        if final_conf > 0 and final_conf < 0.5:
-             logger.warning(f"  -> MATCH DESCARTADO (Confianza Baja {final_conf:.2f}): {os.path.basename(src_path)}")
+        final_conf = _final_confidence(result)
+        if 0 < final_conf < 0.5:
+             logger.warning("  -> MATCH DESCARTADO (Confianza Baja %.2f): %s", final_conf, os.path.basename(src_path))
              return None
 
-        logger.info(f"  -> MATCH ({src_lbl}): {result.get_display_title()} / {result.get_display_artist()}")
+        logger.info("  -> MATCH (%s): %s / %s", src_lbl, result.get_display_title(), result.get_display_artist())
         
         # 4. Escribir Tags
         # Actualizamos el path del metadata para apuntar al archivo destino REAL
@@ -465,14 +727,16 @@ class LibraryManager:
         success = self.tagger.write_metadata(tm)
         if not success:
             logger.warning("  -> Fallo en escritura de tags.")
+        elif not self.dry_run:
+            self._stamp_source_mtime(src_path, dest_path)
         
         return result
 
     def _print_summary(self) -> None:
         logger.info("=== Resumen de Procesamiento ===")
-        logger.info(f"Total Procesados: {self.stats['processed']}")
-        logger.info(f"Exitosos (Match): {self.stats['success']}")
-        logger.info(f"Fallidos (Error): {self.stats['failed']}")
+        logger.info("Total Procesados: %s", self.stats['processed'])
+        logger.info("Exitosos (Match): %s", self.stats['success'])
+        logger.info("Fallidos (Error): %s", self.stats['failed'])
         logger.info("================================")
 
     def export_csv(self, data: List[dict], output_dir: Optional[str] = None) -> str:
@@ -493,35 +757,21 @@ class LibraryManager:
         filename = f"scan_report_{timestamp}.csv"
         filepath = os.path.join(output_dir, filename)
         
-        # Get headers from first item (superset if needed, but UI struct is consistent)
-        fieldnames = [
-            "status", "filename", "original_filename", 
-            "artist", "title", "album", "year", 
-            "genre", "styles", "publisher", "cat_number",
-            "country", "format", "release_type", "release_status",
-            "isrc", "duration_str", "duration_diff", "confidence", "source", 
-            "url_spotify", "url_discogs", "mb_track_id", "mb_release_id", "acoustid"
-        ]
-        
+        data_fields = _CSV_FIELDS[1:]
+
         try:
             with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
-                for row in data:
-                    # Determine status for CSV based on confidence/rescued
-                    status = "READY"
-                    if row.get("confidence", 0) < 50: status = "REJECTED"
-                    elif row.get("rescued"): status = "RESCUED"
-                    
-                    # Inject status if missing from row (UI computes it)
-                    row_copy = row.copy()
-                    row_copy["status"] = status
-                    
-                    writer.writerow(row_copy)
+                writer = csv.writer(f)
+                writer.writerow(_CSV_FIELDS)
+                # Filas como tuplas en orden fijo: sin copiar cada dict ni DictWriter
+                writer.writerows(
+                    (_csv_status(row), *[row.get(k, "") for k in data_fields])
+                    for row in data
+                )
                     
-            logger.info(f"Reporte CSV generado: {filepath}")
+            logger.info("Reporte CSV generado: %s", filepath)
             return filepath
         except Exception as e:
-            logger.error(f"Error generando CSV: {e}")
+            logger.error("Error generando CSV: %s", e)
             raise e
 
@@ -2,6 +2,7 @@ from typing import Optional, List
 from datetime import datetime
 import re
 
+from mp3_autotagger.config import UNKNOWN_ARTIST, UNKNOWN_ALBUM, DEFAULT_GENRE
 from mp3_autotagger.core.models import MBRecording, MBRelease, MBArtist
 from mp3_autotagger.core.matching import DiscogsMatchResult
 from mp3_autotagger.data_structures.schemas import (
@@ -19,7 +20,7 @@ class MusicBrainzMapper:
         
         # 2. Basic Info
         title = recording.title
-        artist = recording.artists[0].name if recording.artists else "Unknown Artist"
+        artist = recording.artists[0].name if recording.artists else UNKNOWN_ARTIST
         
         # 3. Create Editorial
         editorial = EditorialMetadata()
@@ -44,9 +45,9 @@ class MusicBrainzMapper:
         unified = UnifiedTrackData(
             title=title,
             artist_main=artist,
-            album=best_rel.title if best_rel else "Unknown Album",
+            album=best_rel.title if best_rel else UNKNOWN_ALBUM,
             album_artist=artist, # Default to track artist for now
-            genre_main="Electronic", # MB doesn't give good genres usually
+            genre_main=DEFAULT_GENRE, # MB doesn't give good genres usually
             track_number="", # MB Recording doesn't have track number
             disc_number="1/1",
             year=MusicBrainzMapper._extract_year(best_rel.date) if best_rel else "",
@@ -72,12 +73,8 @@ class MusicBrainzMapper:
 
         rec_title = recording.title
         
-        # Sort Key using shared heuristic
-        sorted_releases = sorted(
-            recording.releases, 
-            key=lambda r: ReleaseHeuristics.score_release(r, rec_title)
-        )
-        return sorted_releases[0]
+        # Best release using shared heuristic (min == sorted()[0], sin ordenar todo)
+        return min(recording.releases, key=ReleaseHeuristics.make_score_fn(rec_title))
 
     @staticmethod
     def _map_status(status_str: Optional[str]) -> ReleaseStatus:
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import heapq
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
-from mp3_autotagger.core.models import TrackMetadataBase, MBRelease
+from mp3_autotagger.core.models import TrackMetadataBase, MBRelease, _EMPTY
 from mp3_autotagger.clients.discogs import DiscogsClient, DiscogsClientError
 from mp3_autotagger.core.sanity import analyze_text_sanity, TextSanityResult
 
@@ -15,33 +20,86 @@ from mp3_autotagger.core.sanity import analyze_text_sanity, TextSanityResult
 # Utilidades internas de texto
 # ----------------------------------------------------------------------
 
-WORD_RE = re.compile(r"[a-z0-9]+")
+# Tabla byte -> byte: [a-z0-9] se conservan, todo lo demás pasa a espacio.
+# Equivale a WORD_RE.findall([a-z0-9]+) pero sin pasar por la VM de regex.
+_TOKEN_TABLE = bytes(c if (48 <= c <= 57 or 97 <= c <= 122) else 32 for c in range(256))
 
 
 def _tokenize(text: str) -> List[str]:
     """Tokenización muy simple: lower + solo caracteres alfanuméricos."""
-    text = text.lower()
-    return WORD_RE.findall(text)
+    # errors="replace": cada carácter no ASCII se vuelve "?" y separa tokens,
+    # igual que hacía la regex
+    return text.lower().encode("ascii", "replace").translate(_TOKEN_TABLE).decode("ascii").split()
+
+
+@lru_cache(maxsize=4096)
+def _token_set(text: str) -> FrozenSet[str]:
+    """
+    Conjunto de tokens de un string, memoizado.
+    Los mismos títulos/artistas MB se comparan contra decenas de candidatos:
+    así cada string se tokeniza una sola vez.
+    Los tokens se internan: el mismo token de distintos strings es el mismo
+    objeto, y los lookups en sets / vocabulario resuelven por identidad.
+    """
+    return frozenset(map(sys.intern, _tokenize(text)))
+
+
+def _jaccard_tokens(ta: FrozenSet[str], tb: FrozenSet[str]) -> float:
+    """Jaccard sobre conjuntos de tokens ya calculados."""
+    # isdisjoint corta en el primer token común y no construye el set intersección
+    if not ta or not tb or ta.isdisjoint(tb):
+        return 0.0
+    inter = len(ta & tb)
+    return inter / (len(ta) + len(tb) - inter)
+
+
+class _TokenMasks:
+    """
+    Vocabulario local a un matching: cada token recibe un bit y cada string
+    una máscara int. Jaccard queda en dos operaciones de bits + bit_count.
+    Es por llamada (no global): las máscaras se mantienen pequeñas y no hay
+    estado compartido entre hilos.
+    """
+    __slots__ = ("_vocab", "_masks")
+
+    def __init__(self) -> None:
+        self._vocab: Dict[str, int] = {}
+        self._masks: Dict[str, int] = {}
+
+    def mask(self, text: str) -> int:
+        m = self._masks.get(text)
+        if m is None:
+            vocab = self._vocab
+            m = 0
+            for tok in _token_set(text):
+                m |= 1 << vocab.setdefault(tok, len(vocab))
+            self._masks[text] = m
+        return m
+
+
+def _jaccard_masks(a: int, b: int) -> float:
+    """Jaccard sobre máscaras de _TokenMasks."""
+    inter = a & b
+    # Sin tokens comunes (el caso más frecuente entre candidatos): ni OR ni popcount
+    if not inter:
+        return 0.0
+    return inter.bit_count() / (a | b).bit_count()
 
 
 def _jaccard_similarity(a: str, b: str) -> float:
     """Similitud Jaccard entre tokens de dos strings (0.0 – 1.0)."""
     if not a or not b:
         return 0.0
-    ta = set(_tokenize(a))
-    tb = set(_tokenize(b))
-    if not ta or not tb:
-        return 0.0
-    inter = len(ta & tb)
-    union = len(ta | tb)
-    return inter / union
+    return _jaccard_tokens(_token_set(a), _token_set(b))
 
 
+@lru_cache(maxsize=8192)
 def _split_discogs_title(raw_title: str) -> Tuple[str, str]:
     """
     Muchos títulos de Discogs vienen como 'Artist - Title'.
     Esta función intenta separar eso en (artist_part, title_part).
     Si no se encuentra el patrón, devuelve ("", raw_title) como fallback.
+    Memoizada: el mismo título aparece en extracción, scoring y resultado final.
     """
     if " - " in raw_title:
         parts = raw_title.split(" - ", 1)
@@ -51,17 +109,69 @@ def _split_discogs_title(raw_title: str) -> Tuple[str, str]:
     return "", raw_title.strip()
 
 
-def _contains_any(text: str, keywords: List[str]) -> bool:
-    """True si el texto contiene al menos una palabra clave (case-insensitive)."""
-    t = text.lower()
-    return any(k in t for k in keywords)
+# ----------------------------------------------------------------------
+# Palabras clave del scoring (cada lista compilada a una sola alternancia;
+# búsqueda por substring sobre texto ya en minúsculas, como el `in` original)
+# ----------------------------------------------------------------------
+
+COMPILATION_KEYWORDS_DISCOGS = [
+    "best of", "greatest hits", "compilation", "the very best", "anthology",
+    "various", "collection", "hits", "dance anthems",
+]
+COMPILATION_KEYWORDS_MB = [
+    "best of", "greatest hits", "compilation", "anthology", "various", "collection",
+]
+DJ_MIX_KEYWORDS = [
+    "dj mix", "dj-mix", "mixed by", "continuous mix", "mixtape", "mix compilation",
+]
+GENRE_KEYWORDS = [
+    "house", "techno", "trance", "progressive", "electro", "minimal", "disco",
+    "drum n bass", "drum & bass", "drum and bass", "dubstep", "breaks", "garage",
+]
+
+
+def _keywords_re(keywords: List[str]) -> "re.Pattern[str]":
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+_COMPILATION_DISCOGS_RE = _keywords_re(COMPILATION_KEYWORDS_DISCOGS)
+_COMPILATION_MB_RE = _keywords_re(COMPILATION_KEYWORDS_MB)
+_DJ_MIX_RE = _keywords_re(DJ_MIX_KEYWORDS)
+_GENRE_RE = _keywords_re(GENRE_KEYWORDS)
+
+# Flags de un candidato Discogs (bits). Solo dependen del release (título,
+# formatos, estilos), no del track MB, así que se calculan una vez por release
+_CAND_COMPILATION = 1
+_CAND_MIXED = 2
+_CAND_DJ_MIX = 4
+_CAND_GENRE = 8
+
+
+@lru_cache(maxsize=8192)
+def _candidate_flags(title: str, formats: Tuple[str, ...], styles: Tuple[str, ...]) -> int:
+    """
+    Bitfield de keywords de un release Discogs, memoizado: los tracks de un
+    mismo álbum devuelven los mismos releases una y otra vez.
+    """
+    title_lower = title.lower()
+    formats_lower = " ".join(formats).lower()
+    flags = 0
+    if _COMPILATION_DISCOGS_RE.search(title_lower) or "compilation" in formats_lower:
+        flags |= _CAND_COMPILATION
+    if "mixed" in formats_lower:
+        flags |= _CAND_MIXED
+    if _DJ_MIX_RE.search(title_lower):
+        flags |= _CAND_DJ_MIX
+    if _GENRE_RE.search(" ".join(styles).lower()):
+        flags |= _CAND_GENRE
+    return flags
 
 
 # ----------------------------------------------------------------------
 # Modelos de salida
 # ----------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class DiscogsMatchResult:
     """
     Resultado consolidado del matching MusicBrainz → Discogs para un track.
@@ -99,7 +209,6 @@ class DiscogsMatchResult:
     discogs_track_no: Optional[str] = None
     discogs_media_format: Optional[str] = None
     discogs_cover_url: Optional[str] = None
-    discogs_cover_url: Optional[str] = None
     discogs_release_url: Optional[str] = None
     
     # Credits (Phase 20)
@@ -116,7 +225,8 @@ class DiscogsMatchResult:
     debug_info: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+# Objeto de vida corta y muy numeroso: sin __dict__ ni __eq__ generado
+@dataclass(slots=True, eq=False)
 class DiscogsReleaseCandidate:
     """
     Representa un posible release Discogs devuelto por /database/search.
@@ -128,13 +238,15 @@ class DiscogsReleaseCandidate:
     country: Optional[str]
     label: Optional[str]
     catno: Optional[str]
-    formats: List[str]
-    styles: List[str]
-    genres: List[str] = None
+    formats: Sequence[str]
+    styles: Sequence[str]
+    genres: Sequence[str] = _EMPTY
     cover_image: Optional[str] = None
     resource_url: Optional[str] = None
     # score_base = score calculado frente a MB antes de sanity
     score_base: float = 0.0
+    # Bits _CAND_* (ver _candidate_flags); None = aún no calculados
+    flags: Optional[int] = None
 
 
 # ----------------------------------------------------------------------
@@ -199,6 +311,17 @@ def compute_discogs_confidence_with_sanity(
 
 from mp3_autotagger.data_structures.schemas import UnifiedTrackData
 
+# Pool compartido por todas las llamadas a match_track_mb_to_discogs (que ya
+# corren en los workers de red del manager): queries y detalles de empates van
+# aquí en vez de crear un executor por track. El ritmo real lo marca el rate
+# limiter del DiscogsClient, así que pocos hilos alcanzan.
+_DISCOGS_MATCH_WORKERS = 8
+_DISCOGS_POOL = ThreadPoolExecutor(max_workers=_DISCOGS_MATCH_WORKERS, thread_name_prefix="discogs-match")
+# Máximo de candidatos empatados cuyos detalles (créditos) se piden a la vez
+_DISCOGS_DETAIL_TOP_K = 3
+
+_BY_SCORE = attrgetter("score_base")
+
 # ...
 
 def _build_discogs_queries_from_mb(track: UnifiedTrackData) -> List[Dict[str, Any]]:
@@ -256,64 +379,96 @@ def _build_discogs_queries_from_mb(track: UnifiedTrackData) -> List[Dict[str, An
 
 # ...
 
+# Puntaje por diferencia de años, indexado por min(diff, _YEAR_SCORE_CAP):
+# 0 -> +0.20, 1 -> +0.10, 2-3 -> +0.05, 4-10 -> +0.02, >10 -> -0.05
+_YEAR_SCORE = (0.20, 0.10, 0.05, 0.05) + (0.02,) * 7 + (-0.05,)
+_YEAR_SCORE_CAP = len(_YEAR_SCORE) - 1
+
+
+class _MBScoringContext:
+    """
+    Lado MB del scoring, calculado una vez por track: máscaras, año, país y
+    flags de keywords no dependen del candidato Discogs.
+    """
+    __slots__ = (
+        "masks", "artist_mask", "title_mask", "release_mask", "combo_mask", "year",
+        "country", "is_compilation", "is_dj_mix", "has_genre",
+    )
+
+    def __init__(self, track: UnifiedTrackData, masks: Optional[_TokenMasks] = None) -> None:
+        mb_title = track.title or ""
+        mb_artist = track.artist_main or ""
+        mb_release_title = track.album or ""
+        self.masks = masks if masks is not None else _TokenMasks()
+        mask = self.masks.mask
+        self.artist_mask = mask(mb_artist)
+        self.title_mask = mask(mb_title)
+        self.release_mask = mask(mb_release_title)
+        # Tokens de "artista título release" = unión de los tres campos
+        self.combo_mask = self.artist_mask | self.title_mask | self.release_mask
+
+        self.year: Optional[int] = None
+        if track.editorial.release_date:
+            try:
+                self.year = int(track.editorial.release_date[:4])
+            except Exception:
+                self.year = None
+
+        country = track.editorial.country
+        self.country = country.upper() if country else None
+
+        self.is_compilation = _COMPILATION_MB_RE.search(mb_release_title.lower()) is not None
+        # Título + release MB: el mismo contexto sirve para DJ mix y para género
+        mb_text_mix = f"{mb_title} {mb_release_title}".lower()
+        self.is_dj_mix = _DJ_MIX_RE.search(mb_text_mix) is not None
+        self.has_genre = _GENRE_RE.search(mb_text_mix) is not None
+
+
 def _score_discogs_candidate_against_mb(
     track: UnifiedTrackData,
     cand: DiscogsReleaseCandidate,
+    masks: Optional[_TokenMasks] = None,
+    mb: Optional[_MBScoringContext] = None,
 ) -> float:
     """
     Score UnifiedTrackData vs Discogs Candidate.
+    mb: contexto del lado MB compartido por todos los candidatos del mismo
+    track; si no se pasa, se construye aquí (con `masks` si se da).
     """
-    mb_title = track.title or ""
-    mb_artist = track.artist_main or ""
-    mb_release_title = track.album or ""
-    mb_release_country = track.editorial.country
-
-    # ... (Rest of logic similar but using local vars)
+    if mb is None:
+        mb = _MBScoringContext(track, masks)
+    mask = mb.masks.mask
 
-    mb_year: Optional[int] = None
-    if track.editorial.release_date:
-        try:
-            mb_year = int(track.editorial.release_date[:4])
-        except Exception:
-            mb_year = None
-    
-    # ... logic continues ...
-    # Need to keep the rest of logic same but ensure variable names match
-    
     # Discogs: separar "Artist - Title"
     discogs_artist_part, discogs_title_part = _split_discogs_title(cand.title)
 
     # Artist similarity
     cand_artist_full = (cand.artist or "").strip()
     cand_artist_combo = " ".join(x for x in [cand_artist_full, discogs_artist_part] if x)
-    artist_sim = _jaccard_similarity(mb_artist, cand_artist_combo)
+    artist_sim = _jaccard_masks(mb.artist_mask, mask(cand_artist_combo))
 
-    # Title similarity
-    track_title_sim = _jaccard_similarity(mb_title, discogs_title_part)
+    # Title similarity (el mismo título Discogs se compara contra título y release MB)
+    discogs_title_mask = mask(discogs_title_part)
+    track_title_sim = _jaccard_masks(mb.title_mask, discogs_title_mask)
 
     # Release-title similarity
-    release_title_sim = _jaccard_similarity(mb_release_title, discogs_title_part)
+    release_title_sim = _jaccard_masks(mb.release_mask, discogs_title_mask)
 
     # Año matches
     year_score = 0.0
-    if mb_year is not None and cand.year is not None:
-        diff = abs(mb_year - cand.year)
-        if diff == 0: year_score = 0.20
-        elif diff <= 1: year_score = 0.10
-        elif diff <= 3: year_score = 0.05
-        elif diff <= 10: year_score = 0.02
-        else: year_score = -0.05
-
-    # Compilation Logic
-    title_lower = cand.title.lower()
-    formats_lower = " ".join(cand.formats).lower()
-
-    is_compilation_discogs = any(kw in title_lower for kw in ["best of", "greatest hits", "compilation", "the very best", "anthology", "various", "collection", "hits", "dance anthems"]) or "compilation" in formats_lower
+    if mb.year is not None and cand.year is not None:
+        year_score = _YEAR_SCORE[min(abs(mb.year - cand.year), _YEAR_SCORE_CAP)]
+
+    # Compilation Logic (flags de keywords precalculados por release)
+    flags = cand.flags
+    if flags is None:
+        flags = cand.flags = _candidate_flags(cand.title, tuple(cand.formats), tuple(cand.styles))
+
+    is_compilation_discogs = flags & _CAND_COMPILATION
     
-    is_mixed_cd = any(kw in formats_lower for kw in ["mixed"])
+    is_mixed_cd = flags & _CAND_MIXED
 
-    mb_rel_lower = mb_release_title.lower()
-    is_compilation_mb = any(kw in mb_rel_lower for kw in ["best of", "greatest hits", "compilation", "anthology", "various", "collection"])
+    is_compilation_mb = mb.is_compilation
 
     compilation_penalty = 0.0
     if is_compilation_discogs and not is_compilation_mb:
@@ -326,8 +481,8 @@ def _score_discogs_candidate_against_mb(
 
     # Bonus por país
     country_bonus = 0.0
-    if mb_release_country and cand.country:
-        if mb_release_country.upper() == cand.country.upper():
+    if mb.country and cand.country:
+        if mb.country == cand.country.upper():
             country_bonus = 0.05
 
     # Boost explícito release
@@ -339,17 +494,12 @@ def _score_discogs_candidate_against_mb(
 
     # Bonus DJ
     dj_bonus = 0.0
-    mb_text_mix = f"{mb_title} {mb_release_title}".lower()
-    discogs_text_mix = cand.title.lower()
 
-    if _contains_any(mb_text_mix, DJ_MIX_KEYWORDS) and _contains_any(discogs_text_mix, DJ_MIX_KEYWORDS):
+    if mb.is_dj_mix and flags & _CAND_DJ_MIX:
         dj_bonus += 0.10
 
     # Bonus Styles
-    styles_text = " ".join(cand.styles).lower()
-    mb_context_for_genre = f"{mb_title} {mb_release_title}".lower()
-
-    if _contains_any(styles_text, GENRE_KEYWORDS) and _contains_any(mb_context_for_genre, GENRE_KEYWORDS):
+    if mb.has_genre and flags & _CAND_GENRE:
         dj_bonus += 0.05
 
     score = (
@@ -375,59 +525,83 @@ def _extract_candidates_from_search_response(data: Dict[str, Any]) -> List[Disco
     cands = []
     
     for r in results:
+        g = r.get  # ~12 lookups por resultado: se enlaza el método una vez
         # Filtramos solo releases y masters
-        if r.get("type") not in ("release", "master"):
+        if g("type") not in ("release", "master"):
             continue
             
-        raw_title = r.get("title", "")
+        raw_title = g("title", "")
         
         # Intentar extraer artista del título si no viene explícito
         # En search results, a veces 'artist' no está, y 'title' es 'Artist - Track' o 'Artist - Album'
-        artist_name = r.get("artist") # Try explicit first
+        artist_name = g("artist") # Try explicit first
         if not artist_name:
              # Discogs API sometimes uses "artists" list in newer endpoints, but "search" usually uses "title" combo
              # Check if title has dash
-            if " - " in raw_title:
-               parts = raw_title.split(" - ", 1)
-               artist_name = parts[0].strip()
+            artist_name = _split_discogs_title(raw_title)[0] or artist_name
         
         # Styles / Genres pueden ser list o str
-        styles = r.get("style", []) or r.get("styles", [])
+        # (sin valor -> _EMPTY compartido en vez de una lista nueva por candidato)
+        styles = g("style") or g("styles") or _EMPTY
         if isinstance(styles, str): styles = [styles]
         
-        genres = r.get("genre", []) or r.get("genres", [])
+        genres = g("genre") or g("genres") or _EMPTY
         if isinstance(genres, str): genres = [genres]
         
         # Formats
-        formats = r.get("format", [])
+        formats = g("format") or _EMPTY
         if isinstance(formats, str): formats = [formats]
         
         # Label
-        lbl = r.get("label", [])
+        lbl = g("label", [])
         label_str = None
         if isinstance(lbl, list) and lbl:
             label_str = lbl[0]
         elif isinstance(lbl, str):
             label_str = lbl
 
+        year = g("year")
         c = DiscogsReleaseCandidate(
-            id=r.get("id"),
+            id=g("id"),
             title=raw_title,
             artist=artist_name, # Extracted
-            year=int(r.get("year")) if r.get("year") else None,
-            country=r.get("country"),
+            year=int(year) if year else None,
+            country=g("country"),
             label=label_str,
-            catno=r.get("catno"),
+            catno=g("catno"),
             formats=formats,
             styles=styles,
             genres=genres,
-            cover_image=r.get("thumb") or r.get("cover_image"),
-            resource_url=r.get("resource_url")
+            cover_image=g("thumb") or g("cover_image"),
+            resource_url=g("resource_url"),
+            flags=_candidate_flags(raw_title, tuple(formats), tuple(styles)),
         )
         cands.append(c)
         
     return cands
 
+
+# Sanity neutro mientras analyze_text_sanity no acepte UnifiedTrackData.
+# Instancia única a nivel de módulo: compute_discogs_confidence_with_sanity
+# solo lee sus atributos.
+_NEUTRAL_SANITY = TextSanityResult(
+    sanity_score=1.0,
+    artist_similarity=1.0,
+    title_similarity=1.0,
+    is_youtube_rip=False,
+    is_mashup_or_edit=False,
+)
+
+
+def _fetch_release_safe(client: DiscogsClient, release_id: int) -> Optional[Dict[str, Any]]:
+    """get_release que no corta el matching: sin detalles solo se pierden créditos."""
+    try:
+        return client.get_release(release_id)
+    except Exception as e:
+        print(f"[Discogs] Warning: Could not fetch full details for {release_id}: {e}")
+        return None
+
+
 def match_track_mb_to_discogs(
     track_meta: UnifiedTrackData,
     client: DiscogsClient,
@@ -449,16 +623,8 @@ def match_track_mb_to_discogs(
     # Mocking sanity temporarily inside here or removing reliance?
     # Logic uses sanity.sanity_score deeply.
     # We should update analyze_text_sanity too. 
-    # Whatever, let's create a dummy sanity struct so code doesn't break
-    
-    class DummySanity:
-        sanity_score = 1.0
-        artist_similarity = 1.0
-        title_similarity = 1.0
-        is_youtube_rip = False
-        is_mashup_or_edit = False
-    
-    sanity = DummySanity() # TODO: Update sanity.py to accept UnifiedTrackData
+    # Whatever, let's use a neutral sanity struct so code doesn't break
+    sanity = _NEUTRAL_SANITY # TODO: Update sanity.py to accept UnifiedTrackData
 
     queries = _build_discogs_queries_from_mb(track_meta)
     
@@ -466,11 +632,18 @@ def match_track_mb_to_discogs(
     
     # Copy-paste logic from original function for execution...
     
-    all_candidates: List[DiscogsReleaseCandidate] = []
+    # Las tres queries devuelven muchos releases repetidos: se deduplica por id
+    # al recoger (se conserva la primera aparición, así el desempate de max()
+    # no cambia) y cada release se puntúa una sola vez
+    seen: Dict[Any, DiscogsReleaseCandidate] = {}
 
     try:
-        for q in queries:
-            data = client.search_releases(
+        # Las queries son independientes: se lanzan a la vez y el rate limiter
+        # del cliente las espacia. Se recogen en orden de query para que el
+        # dedupe por id y el desempate del max sigan siendo deterministas.
+        futures = [
+            _DISCOGS_POOL.submit(
+                client.search_releases,
                 artist=q["artist"],
                 release_title=q["release_title"],
                 track_title=q["track_title"],
@@ -478,8 +651,11 @@ def match_track_mb_to_discogs(
                 per_page=20,
                 page=1,
             )
-            cands = _extract_candidates_from_search_response(data)
-            all_candidates.extend(cands)
+            for q in queries
+        ]
+        for fut in futures:
+            for cand in _extract_candidates_from_search_response(fut.result()):
+                seen.setdefault(cand.id, cand)
 
     except DiscogsClientError as e:
         print(f"[Discogs matching] Error: {e}")
@@ -507,6 +683,8 @@ def match_track_mb_to_discogs(
             debug_info={"error": str(e)},
         )
 
+    all_candidates = list(seen.values())
+
     if not all_candidates:
          return DiscogsMatchResult(
             file_path=track_meta.filepath_original,
@@ -531,13 +709,17 @@ def match_track_mb_to_discogs(
         )
 
     # Score
+    # El lado MB se precalcula una vez y se comparte entre candidatos
+    mb_ctx = _MBScoringContext(track_meta)
     for cand in all_candidates:
-        cand.score_base = _score_discogs_candidate_against_mb(track_meta, cand)
+        cand.score_base = _score_discogs_candidate_against_mb(track_meta, cand, mb=mb_ctx)
 
-    best_cand = max(all_candidates, key=lambda c: c.score_base)
+    best_cand = max(all_candidates, key=_BY_SCORE)
 
-    mb_combo = " ".join(x for x in [mb_artist or "", mb_title or "", mb_release_title or ""] if x)
-    mb_discogs_title_sim = _jaccard_similarity(mb_combo, best_cand.title)
+    # Similitud global MB (artista + título + release) vs título Discogs, con
+    # las máscaras MB ya calculadas para el scoring
+    mask = mb_ctx.masks.mask
+    mb_discogs_title_sim = _jaccard_masks(mb_ctx.combo_mask, mask(best_cand.title))
 
     final_score, conf_label = compute_discogs_confidence_with_sanity(
         best_cand.score_base,
@@ -569,11 +751,32 @@ def match_track_mb_to_discogs(
         )
         
     # Phase 20: Fetch Full Details for Credits
-    full_release = None
-    try:
-        full_release = client.get_release(best_cand.id)
-    except Exception as e:
-        print(f"[Discogs] Warning: Could not fetch full details for {best_cand.id}: {e}")
+    # Empates exactos en score_base (represses, ediciones gemelas): max() elegía
+    # el primero a ciegas. Se piden sus detalles en paralelo y se prefiere el
+    # que trae créditos; sin empate sigue siendo una sola llamada.
+    tied = [
+        c for c in heapq.nlargest(_DISCOGS_DETAIL_TOP_K, all_candidates, key=_BY_SCORE)
+        if c.score_base == best_cand.score_base
+    ]
+    if len(tied) == 1:
+        # Caso habitual: sin empate, una sola llamada directa
+        details = {best_cand.id: _fetch_release_safe(client, best_cand.id)}
+    else:
+        details = dict(zip((c.id for c in tied), _DISCOGS_POOL.map(partial(_fetch_release_safe, client), (c.id for c in tied))))
+
+    # nlargest es estable (== sorted(...)[:k]): tied[0] es best_cand, como en max()
+    if not (details.get(best_cand.id) or {}).get("extraartists"):
+        for cand in tied[1:]:
+            if not (details.get(cand.id) or {}).get("extraartists"):
+                continue
+            cand_score, cand_label = compute_discogs_confidence_with_sanity(
+                cand.score_base, sanity, _jaccard_masks(mb_ctx.combo_mask, mask(cand.title))
+            )
+            if cand_label != "SIN_MATCH_DISCOGS":
+                best_cand, final_score, conf_label = cand, cand_score, cand_label
+            break
+
+    full_release = details.get(best_cand.id)
 
     # Extract Credits
     mastered, mixed, remixed = None, None, None
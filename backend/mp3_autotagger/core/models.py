@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 
 
+# Default compartido para listas de solo lectura: una tupla vacía es inmutable,
+# así que todas las instancias pueden apuntar a la misma sin un list() por objeto
+_EMPTY: tuple = ()
+
 # ------------------------------------------------------
 # ARTIST
 # ------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class MBArtist:
     id: str
     name: str
@@ -17,7 +21,7 @@ class MBArtist:
 # ------------------------------------------------------
 # RELEASE
 # ------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class MBRelease:
     id: str
     title: str
@@ -26,28 +30,27 @@ class MBRelease:
     status: Optional[str] = None
     release_group_id: Optional[str] = None
     release_group_type: Optional[str] = None
-    media_formats: List[str] = field(default_factory=list)
+    media_formats: Sequence[str] = _EMPTY
 
 
 # ------------------------------------------------------
 # RECORDING
 # ------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class MBRecording:
     id: str
     title: str
     length: Optional[int] = None  # milisegundos
     artists: List[MBArtist] = field(default_factory=list)
     releases: List[MBRelease] = field(default_factory=list)
-    releases: List[MBRelease] = field(default_factory=list)
-    tags: List[str] = field(default_factory=list)
-    isrcs: List[str] = field(default_factory=list)
+    tags: Sequence[str] = _EMPTY
+    isrcs: Sequence[str] = _EMPTY
 
 
 # ------------------------------------------------------
 # TRACK METADATA BASE (Fase 1 + Fase 2)
 # ------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class TrackMetadataBase:
     """
     Metadatos consolidados de un track.
@@ -117,18 +120,14 @@ class TrackMetadataBase:
         releases = self.mb_recording.releases
         rec_title = self.mb_recording.title
         
-        # Sort using the heuristic key
-        sorted_releases = sorted(
-            releases, 
-            key=lambda r: ReleaseHeuristics.score_release(r, rec_title)
-        )
-        return sorted_releases[0] if sorted_releases else None
+        # Best release using the heuristic key (min == sorted()[0], sin ordenar todo)
+        return min(releases, key=ReleaseHeuristics.make_score_fn(rec_title))
 
 
 # ------------------------------------------------------
 # GENERIC TRACK (Search Result)
 # ------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class Track:
     """
     Representación genérica de un track obtenido de una fuente externa (Beatport, Juno, etc).
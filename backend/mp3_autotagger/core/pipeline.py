@@ -1,13 +1,16 @@
 from __future__ import annotations
 import logging
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 import os
 import re
 
-from mp3_autotagger.data_structures.schemas import UnifiedTrackData, ExternalIDs, EditorialMetadata, AudioFeatures
-from mp3_autotagger.config import CONFIDENCE_THRESHOLD_HIGH
+from mp3_autotagger.data_structures.schemas import UnifiedTrackData, ExternalIDs, EditorialMetadata, AudioFeatures, TXXXKeys
+from mp3_autotagger.config import (
+    CONFIDENCE_THRESHOLD_HIGH, UNKNOWN_ARTIST, UNKNOWN_TITLE, UNKNOWN_ALBUM, DEFAULT_GENRE
+)
 from mp3_autotagger.core.mappers import MusicBrainzMapper, DiscogsMapper
 from mp3_autotagger.services.identity import IdentityService
 from mp3_autotagger.services.enrichment import EnrichmentService
@@ -18,12 +21,30 @@ from mp3_autotagger.clients.musicbrainz import MusicBrainzClient
 from mp3_autotagger.clients.spotify import SpotifyClient
 from mp3_autotagger.core.models import MBRecording, MBArtist, MBRelease
 from mp3_autotagger.clients.discogs import DiscogsClient
-from mp3_autotagger.core.matching import match_track_mb_to_discogs, DiscogsMatchResult, _jaccard_similarity
+from mp3_autotagger.core.matching import match_track_mb_to_discogs, DiscogsMatchResult
 from mp3_autotagger.utils.images import download_image
 from mp3_autotagger.utils.normalization import remove_accents
 from mp3_autotagger.utils.cleaner import FilenameCleaner
 
-@dataclass
+# Palabras Unicode (\w): a diferencia del tokenizer ASCII de matching, no
+# vacía nombres en cirílico, griego o japonés
+_ARTIST_WORD_RE = re.compile(r"\w+")
+
+
+def _artist_similarity(a: str, b: str) -> float:
+    """
+    Jaccard de palabras entre dos nombres de artista, sin acentos ni
+    mayúsculas y sin puntuación ("Beyoncé," == "beyonce", "Кино" == "КИНО").
+    """
+    ta = set(_ARTIST_WORD_RE.findall(remove_accents(a or "").casefold()))
+    tb = set(_ARTIST_WORD_RE.findall(remove_accents(b or "").casefold()))
+    if not ta or not tb:
+        return 0.0
+    inter = len(ta & tb)
+    return inter / (len(ta) + len(tb) - inter)
+
+
+@dataclass(slots=True)
 class ProcessingResult:
     """
     Resultado final del procesamiento de un archivo.
@@ -33,26 +54,120 @@ class ProcessingResult:
     track_metadata: UnifiedTrackData
     discogs_result: Optional[DiscogsMatchResult] = None
     spotify_used: bool = False
+    # Duración del archivo local (segundos), ya leída por analyze_file
+    local_duration_sec: Optional[float] = None
+    # Portada embebida (APIC) del archivo local, también de analyze_file
+    local_cover_bytes: Optional[bytes] = field(default=None, repr=False)
+    # True si el resultado sale solo de los tags locales (ver PipelineCore._local_result):
+    # no hubo match remoto que verificar ni nada nuevo que escribir
+    local_only: bool = False
     
     def get_display_title(self) -> str:
-        return self.track_metadata.title or "Unknown Title"
+        return self.track_metadata.title or UNKNOWN_TITLE
 
     def get_display_artist(self) -> str:
-        return self.track_metadata.artist_main or "Unknown Artist"
+        return self.track_metadata.artist_main or UNKNOWN_ARTIST
 
 class PipelineCore:
-    def __init__(self, use_discogs: bool = True, use_spotify: bool = True):
+    # Búsquedas Discogs por filename en vuelo a la vez (solapadas con AcoustID/MB/Spotify)
+    DISCOGS_WORKERS = 4
+    # Frames ID3 que tienen que estar presentes para dar por buenos los tags locales
+    LOCAL_REQUIRED_TAGS = ("TIT2", "TPE1", "TALB", "TDRC", "TCON")
+
+    def __init__(self, use_discogs: bool = True, use_spotify: bool = True, force_refetch: bool = False):
         self.logger = logging.getLogger(__name__)
         self.mb_client = MusicBrainzClient()
         self.use_discogs = use_discogs
         self.use_spotify = use_spotify
+        # Si es False, los archivos ya etiquetados (ver _local_result) no pasan por la red
+        self.force_refetch = force_refetch
         self.discogs_client = DiscogsClient() if use_discogs else None
+        # Búsquedas Discogs por filename en segundo plano (ver process_file);
+        # el rate limiter del cliente sigue marcando el ritmo real
+        self._discogs_pool = ThreadPoolExecutor(max_workers=self.DISCOGS_WORKERS) if use_discogs else None
         self.spotify_client = SpotifyClient() if use_spotify else None
 
         # Pipeline 2.0 Services
         self.identity_service = IdentityService(self.spotify_client, self.mb_client)
         self.enrichment_service = EnrichmentService(self.discogs_client, self.spotify_client)
 
+    def _local_result(self, file_path: str, base_info: Dict[str, Any]) -> Optional[ProcessingResult]:
+        """
+        Resultado armado solo con los tags locales, si ya pasan el QA: todos los
+        campos de LOCAL_REQUIRED_TAGS y al menos un ID de MusicBrainz / Discogs /
+        Spotify en TXXX (es decir, un archivo que ya etiquetamos antes).
+        Devuelve None si hace falta consultar los servicios remotos.
+        """
+        tags = base_info["tags"]
+        if not all(tags.get(key) for key in self.LOCAL_REQUIRED_TAGS):
+            return None
+        ids = ExternalIDs(
+            musicbrainz_track_id=tags.get(TXXXKeys.MB_TRACK_ID),
+            discogs_release_id=tags.get(TXXXKeys.DISCOGS_RELEASE_ID),
+            spotify_id=tags.get(TXXXKeys.SPOTIFY_ID),
+        )
+        if not (ids.musicbrainz_track_id or ids.discogs_release_id or ids.spotify_id):
+            return None
+
+        track_meta = UnifiedTrackData(
+            title=tags["TIT2"],
+            artist_main=tags["TPE1"],
+            album=tags["TALB"],
+            album_artist="",
+            genre_main=tags["TCON"],
+            track_number="",
+            disc_number="",
+            # Fecha completa: el Tagger no debe recortar "2003-05-12" a "2003"
+            year=tags["TDRC"],
+            ids=ids,
+            # Sin confianza: los IDs pueden venir de otro tagger (Picard usa los
+            # mismos TXXX), así que no se auto-seleccionan en la UI
+            filepath_original=file_path
+        )
+        track_meta.editorial.publisher = tags.get("TPUB")
+        self.logger.info("[Local] Tags completos, se omiten los servicios remotos: %s", os.path.basename(file_path))
+
+        return ProcessingResult(
+            file_path=file_path,
+            track_metadata=track_meta,
+            local_duration_sec=base_info.get("duration"),
+            local_cover_bytes=base_info.get("cover"),
+            local_only=True
+        )
+
+    def _discogs_filename_search(self, file_path: str, cleaned_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Búsqueda Discogs por nombre de archivo (paso 3). Solo depende de la
+        ruta, así que process_file la lanza en paralelo con AcoustID/MB/Spotify.
+        """
+        label_why = "Migration-Fallback"
+        
+        # Phase 15: Smart Cleaning (cleaned_name = FilenameCleaner.clean(file_path))
+        self.logger.debug("[Fallback] Intentando Discogs por nombre de archivo... (%s)", label_why)
+        self.logger.debug("[Cleaner] Original: %s", os.path.basename(file_path))
+        self.logger.debug("[Cleaner] Limpio:   %s", cleaned_name)
+        
+        c_artist, c_title = FilenameCleaner.extract_artist_title(cleaned_name)
+        
+        if c_artist and c_title:
+            self.logger.debug("[Cleaner] Detectado: %s - %s", c_artist, c_title)
+            # Search precise
+            fallback_res = self.discogs_client.search_releases(artist=c_artist, track_title=c_title, per_page=1).get("results", [])
+            fallback_res = fallback_res[0] if fallback_res else None
+            if not fallback_res:
+                 # Relaxed
+                 query = f"{c_artist} - {c_title}"
+                 self.logger.debug("[Fallback] Re-intentando (RELAJADA): '%s'", query)
+                 fallback_res = self.discogs_client.search_releases(query=query, per_page=1).get("results", [])
+                 fallback_res = fallback_res[0] if fallback_res else None
+        else:
+             # Search query
+             self.logger.debug("[Cleaner] Buscando por query: '%s'", cleaned_name)
+             fallback_res = self.discogs_client.search_releases(query=cleaned_name, per_page=1).get("results", [])
+             fallback_res = fallback_res[0] if fallback_res else None
+
+        return fallback_res
+
     def process_file(self, file_path: str) -> ProcessingResult:
         """
         Ejecuta el pipeline completo para un archivo:
@@ -62,13 +177,31 @@ class PipelineCore:
         4. Spotify (Fallback & Enrich)
         5. Discogs (Linked/Fallback)
         """
-        # 1. Análisis y AcoustID
+        # 1. Análisis local: si los tags ya están completos no hace falta la red
         base_info = analyze_file(file_path)
+        if not self.force_refetch:
+            local = self._local_result(file_path, base_info)
+            if local is not None:
+                return local
+
+        file_name = os.path.basename(file_path)
+        # Nombre limpio (Phase 15): lo usan la búsqueda Discogs y el QA final
+        cleaned_name = FilenameCleaner.clean(file_path)
+
+        # La búsqueda Discogs por filename no depende de nada de lo que sigue:
+        # arranca ya y se recoge en el paso 3 (si algo falla antes, su
+        # resultado se descarta; la respuesta igual queda en la caché HTTP)
+        discogs_future = (
+            self._discogs_pool.submit(self._discogs_filename_search, file_path, cleaned_name)
+            if self.use_discogs else None
+        )
+
+        # AcoustID
         candidates = identify_with_acoustid(file_path)
         best_cand = select_best_acoustid_candidate(
             candidates, 
             original_tags=base_info["tags"], 
-            filename=os.path.basename(file_path)
+            filename=file_name
         )
         
         # 2. MusicBrainz (via Mapper)
@@ -86,28 +219,35 @@ class PipelineCore:
                 track_meta.ids.acoustid_fingerprint = best_cand.get("recording_id")
         else:
             # Create Empty / Local
+            tags = base_info["tags"]
+
+            def first(key: str, default: str = "") -> str:
+                # Primer valor del tag local, o default si falta / está vacío
+                return (tags.get(key) or (default,))[0]
+
             track_meta = UnifiedTrackData(
-                title=base_info["tags"].get("title", [os.path.basename(file_path)])[0] if base_info["tags"].get("title") else os.path.basename(file_path),
-                artist_main=base_info["tags"].get("artist", ["Unknown Artist"])[0] if base_info["tags"].get("artist") else "Unknown Artist",
-                album=base_info["tags"].get("album", [""])[0] if base_info["tags"].get("album") else "",
-                album_artist=base_info["tags"].get("albumartist", [""])[0] if base_info["tags"].get("albumartist") else "",
-                genre_main=base_info["tags"].get("genre", [""])[0] if base_info["tags"].get("genre") else "",
-                track_number=base_info["tags"].get("tracknumber", [""])[0] if base_info["tags"].get("tracknumber") else "",
-                disc_number=base_info["tags"].get("discnumber", [""])[0] if base_info["tags"].get("discnumber") else "",
-                year=base_info["tags"].get("date", [""])[0] if base_info["tags"].get("date") else "",
+                title=first("title", file_name),
+                artist_main=first("artist", UNKNOWN_ARTIST),
+                album=first("album"),
+                album_artist=first("albumartist"),
+                genre_main=first("genre"),
+                track_number=first("tracknumber"),
+                disc_number=first("discnumber"),
+                year=first("date"),
                 filepath_original=file_path
             )
         
         # 4. Spotify Integration (Enrichment Or Fallback)
         spotify_used = False
+        best_spot = None
         
         # Decide search query from Unified Data
         search_artist = track_meta.artist_main
         search_title = track_meta.title
         
         # If unknown, try simplified filename parsing
-        if not search_artist or search_artist == "Unknown Artist":
-             clean_name_for_search = clean_filename(os.path.basename(file_path))
+        if not search_artist or search_artist == UNKNOWN_ARTIST:
+             clean_name_for_search = clean_filename(file_name)
              if " - " in clean_name_for_search:
                  parts = clean_name_for_search.split(" - ", 1)
                  search_artist = parts[0].strip()
@@ -124,7 +264,7 @@ class PipelineCore:
                 # STRICT RULE: Match Confidence > 90%
                 # ---------------------------------------------------------
                 if best_spot.score < CONFIDENCE_THRESHOLD_HIGH: # 0.90
-                    self.logger.warning(f"[Strict] Match descartado por baja confianza ({best_spot.score:.2f} < {CONFIDENCE_THRESHOLD_HIGH})")
+                    self.logger.warning("[Strict] Match descartado por baja confianza (%.2f < %s)", best_spot.score, CONFIDENCE_THRESHOLD_HIGH)
                     best_spot = None
                     spotify_used = False
                 
@@ -138,19 +278,19 @@ class PipelineCore:
                     if local_dur:
                         diff = abs(local_dur - match_dur_sec)
                         if diff > 5.0:
-                            self.logger.warning(f"[Strict] Match descartado por duración: Local={local_dur:.1f}s vs Match={match_dur_sec:.1f}s (Diff={diff:.1f}s)")
+                            self.logger.warning("[Strict] Match descartado por duración: Local=%.1fs vs Match=%.1fs (Diff=%.1fs)", local_dur, match_dur_sec, diff)
                             best_spot = None
                             spotify_used = False
 
                 if best_spot:
-                    self.logger.info(f"Spotify Match: {best_spot.title} ({best_spot.artist}) [Score={best_spot.score:.2f}]")
+                    self.logger.info("Spotify Match: %s (%s) [Score=%.2f]", best_spot.title, best_spot.artist, best_spot.score)
                     spotify_used = True
                     
                     # FORCE Overwrite of Title/Artist to clean data (User Rule: "Never leave filename")
                     track_meta.title = best_spot.title
                     track_meta.artist_main = best_spot.artist
                     
-                    if not track_meta.album or track_meta.album == "Unknown Album":
+                    if not track_meta.album or track_meta.album == UNKNOWN_ALBUM:
                         track_meta.album = best_spot.album
                     if not track_meta.year and best_spot.year:
                         track_meta.year = best_spot.year
@@ -170,33 +310,8 @@ class PipelineCore:
         discogs_res = None
         fallback_res = None
 
-        if self.use_discogs:
-            label_why = "Migration-Fallback"
-            
-            # Phase 15: Smart Cleaning
-            cleaned_name = FilenameCleaner.clean(file_path)
-            self.logger.debug(f"[Fallback] Intentando Discogs por nombre de archivo... ({label_why})")
-            self.logger.debug(f"[Cleaner] Original: {os.path.basename(file_path)}")
-            self.logger.debug(f"[Cleaner] Limpio:   {cleaned_name}")
-            
-            c_artist, c_title = FilenameCleaner.extract_artist_title(cleaned_name)
-            
-            if c_artist and c_title:
-                self.logger.debug(f"[Cleaner] Detectado: {c_artist} - {c_title}")
-                # Search precise
-                fallback_res = self.discogs_client.search_releases(artist=c_artist, track_title=c_title, per_page=1).get("results", [])
-                fallback_res = fallback_res[0] if fallback_res else None
-                if not fallback_res:
-                     # Relaxed
-                     query = f"{c_artist} - {c_title}"
-                     self.logger.debug(f"[Fallback] Re-intentando (RELAJADA): '{query}'")
-                     fallback_res = self.discogs_client.search_releases(query=query, per_page=1).get("results", [])
-                     fallback_res = fallback_res[0] if fallback_res else None
-            else:
-                 # Search query
-                 self.logger.debug(f"[Cleaner] Buscando por query: '{cleaned_name}'")
-                 fallback_res = self.discogs_client.search_releases(query=cleaned_name, per_page=1).get("results", [])
-                 fallback_res = fallback_res[0] if fallback_res else None
+        if discogs_future is not None:
+            fallback_res = discogs_future.result()
 
         # If there was a Discogs fallback, populate
         if fallback_res:
@@ -230,20 +345,12 @@ class PipelineCore:
         if discogs_res:
             should_enrich = True
             
-            if spotify_used and 'best_spot' in locals() and best_spot:
-                 # Normalize
-                 spot_artist = (track_meta.artist_main or "").lower()
-                 disc_artist = (discogs_res.discogs_artist or "").lower()
-                 
-                 # Simple Set Jaccard
-                 s1 = set(spot_artist.split())
-                 s2 = set(disc_artist.split())
-                 intersection = len(s1.intersection(s2))
-                 union = len(s1.union(s2))
-                 sim = intersection / union if union > 0 else 0.0
+            if spotify_used and best_spot is not None:
+                 # Sin acentos ni puntuación, y válido para cualquier script
+                 sim = _artist_similarity(track_meta.artist_main, discogs_res.discogs_artist)
                  
                  if sim < 0.2: # Totally different artist
-                     self.logger.warning(f"[Aviso] Discogs falló (Artista diferente: '{discogs_res.discogs_artist}' vs '{track_meta.artist_main}'), usando metadatos de Spotify como definitivo.")
+                     self.logger.warning("[Aviso] Discogs falló (Artista diferente: '%s' vs '%s'), usando metadatos de Spotify como definitivo.", discogs_res.discogs_artist, track_meta.artist_main)
                      should_enrich = False
                      discogs_res = None # Discard bad match
             
@@ -252,10 +359,10 @@ class PipelineCore:
             
         elif self.use_spotify and self.spotify_client and (not track_meta.title or spotify_used):
              # 5.b. Check if we need a "Hail Mary" Spotify Search (Identity V2)
-             if not track_meta.title or track_meta.title == "Unknown Title":
-                 identity = self.identity_service.identify_track(file_path)
+             if not track_meta.title:
+                 identity = self.identity_service.identify_track(file_path, duration=base_info.get("duration"))
                  if identity:
-                     self.logger.info(f"[Identity] Match via IdentityService: {identity.title} ({identity.artist})")
+                     self.logger.info("[Identity] Match via IdentityService: %s (%s)", identity.title, identity.artist)
                      track_meta.title = identity.title
                      track_meta.artist_main = identity.artist
                      track_meta.album = identity.album
@@ -265,12 +372,12 @@ class PipelineCore:
                      spotify_used = True
              
              if track_meta.title:
-                 self.logger.info(f"[Aviso] Discogs falló, usando metadatos de Spotify como definitivo.")
+                 self.logger.info("[Aviso] Discogs falló, usando metadatos de Spotify como definitivo.")
 
         # 6. Quality Assurance / Enrichment
         # Check for ANY missing critical field
         should_enrich = False
-        if not track_meta.album or track_meta.album == "None": should_enrich = True
+        if not track_meta.album: should_enrich = True
         if not track_meta.year: should_enrich = True
         if not track_meta.genre_main: should_enrich = True
         if not track_meta.editorial.publisher: should_enrich = True # Label
@@ -278,12 +385,12 @@ class PipelineCore:
         if track_meta.title and should_enrich:
              self.logger.info("[QA] Datos incompletos detectados. Iniciando Enriquecimiento...")
              
-             if track_meta.artist_main == "Unknown Artist" or "Unknown" in track_meta.title:
-                 clean_fname = FilenameCleaner.clean(file_path)
+             if track_meta.artist_main == UNKNOWN_ARTIST:
+                 clean_fname = cleaned_name
                  c_artist, c_title = FilenameCleaner.extract_artist_title(clean_fname)
                  
                  if c_artist and c_title:
-                     self.logger.info(f"[Smart Clean] Fixing dirty metadata for search: '{track_meta.artist_main}' -> '{c_artist}'")
+                     self.logger.info("[Smart Clean] Fixing dirty metadata for search: '%s' -> '%s'", track_meta.artist_main, c_artist)
                      track_meta.artist_main = c_artist
                      track_meta.title = c_title
                  else:
@@ -302,38 +409,38 @@ class PipelineCore:
              
              enriched = self.enrichment_service.enrich(current_id, duration_ms=track_meta.audio.duration_ms)
              
-             if enriched.album and (not track_meta.album or track_meta.album == "None"):
+             if enriched.album and not track_meta.album:
                  track_meta.album = enriched.album
-                 self.logger.info(f"[QA] Álbum recuperado y GUARDADO: {track_meta.album}")
+                 self.logger.info("[QA] Álbum recuperado y GUARDADO: %s", track_meta.album)
                  
              if enriched.title and enriched.title != track_meta.title:
                   track_meta.title = enriched.title
-                  self.logger.info(f"[Correction] Título corregido: {track_meta.title}")
+                  self.logger.info("[Correction] Título corregido: %s", track_meta.title)
              if enriched.artist and enriched.artist != track_meta.artist_main:
                   track_meta.artist_main = enriched.artist
-                  self.logger.info(f"[Correction] Artista corregido: {track_meta.artist_main}")
+                  self.logger.info("[Correction] Artista corregido: %s", track_meta.artist_main)
                  
              if enriched.year and (not track_meta.year):
                  track_meta.year = str(enriched.year)
                  track_meta.editorial.release_date = str(enriched.year)
-                 self.logger.info(f"[QA] Año recuperado y GUARDADO: {track_meta.year}")
+                 self.logger.info("[QA] Año recuperado y GUARDADO: %s", track_meta.year)
                  
              if enriched.label and not track_meta.editorial.publisher:
                  track_meta.editorial.publisher = enriched.label
-                 self.logger.info(f"[QA] Sello recuperado y GUARDADO: {track_meta.editorial.publisher}")
+                 self.logger.info("[QA] Sello recuperado y GUARDADO: %s", track_meta.editorial.publisher)
 
              if enriched.catalog_number and not track_meta.editorial.catalog_number:
                  track_meta.editorial.catalog_number = enriched.catalog_number
-                 self.logger.info(f"[QA] Catálogo recuperado y GUARDADO: {track_meta.editorial.catalog_number}")
+                 self.logger.info("[QA] Catálogo recuperado y GUARDADO: %s", track_meta.editorial.catalog_number)
                  
-             if enriched.genre and (not track_meta.genre_main or track_meta.genre_main == "Electronic"):
+             if enriched.genre and (not track_meta.genre_main or track_meta.genre_main == DEFAULT_GENRE):
                  track_meta.genre_main = enriched.genre
                  
              if enriched.styles:
                  current_styles = set(track_meta.editorial.styles)
                  new_styles = set(enriched.styles)
                  track_meta.editorial.styles = list(current_styles.union(new_styles))
-                 self.logger.info(f"[QA] Estilos recuperados: {', '.join(enriched.styles)}")
+                 self.logger.info("[QA] Estilos recuperados: %s", ', '.join(enriched.styles))
              if enriched.discogs_release_id and not track_meta.ids.discogs_release_id:
                  track_meta.ids.discogs_release_id = str(enriched.discogs_release_id)
              if enriched.discogs_master_id and not track_meta.ids.discogs_master_id:
@@ -348,7 +455,7 @@ class PipelineCore:
                  
              if enriched.match_confidence > 0.0:
                  track_meta.match_confidence = enriched.match_confidence
-                 self.logger.info(f"[QA] Index de Confianza actualizado por Enriquecimiento: {track_meta.match_confidence:.2f}")
+                 self.logger.info("[QA] Index de Confianza actualizado por Enriquecimiento: %.2f", track_meta.match_confidence)
 
              # Credits (Phase 24)
              if enriched.mastered_by: track_meta.editorial.credits_mastering = enriched.mastered_by
@@ -356,18 +463,20 @@ class PipelineCore:
              if enriched.remixed_by: track_meta.editorial.remixer = enriched.remixed_by
 
         # Descargar imagen
-        if spotify_used and 'best_spot' in locals() and best_spot:
+        if spotify_used and best_spot is not None:
             track_meta.temp_cover_url = best_spot.cover_url
         if discogs_res and discogs_res.discogs_cover_url:
             track_meta.temp_cover_url = discogs_res.discogs_cover_url
             
         if hasattr(track_meta, "temp_cover_url") and track_meta.temp_cover_url:
-             self.logger.debug(f"Descargando portada: {track_meta.temp_cover_url}")
+             self.logger.debug("Descargando portada: %s", track_meta.temp_cover_url)
              track_meta.temp_cover_bytes = download_image(track_meta.temp_cover_url)
 
         return ProcessingResult(
             file_path=file_path,
             track_metadata=track_meta,
             discogs_result=discogs_res,
-            spotify_used=spotify_used
+            spotify_used=spotify_used,
+            local_duration_sec=base_info.get("duration"),
+            local_cover_bytes=base_info.get("cover")
         )
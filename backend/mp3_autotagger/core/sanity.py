@@ -3,20 +3,19 @@
 from __future__ import annotations
 
 import os
-import re
 from dataclasses import dataclass
 from typing import Optional, Set
 
 from mp3_autotagger.core.models import TrackMetadataBase
 
 
-WORD_RE = re.compile(r"[a-z0-9]+")
+# [a-z0-9] se conservan, el resto de bytes pasa a espacio (ver matching._tokenize)
+_TOKEN_TABLE = bytes(c if (48 <= c <= 57 or 97 <= c <= 122) else 32 for c in range(256))
 
 
 def _tokenize(text: str) -> Set[str]:
     """Tokenización simple: lower-case y solo caracteres alfanuméricos."""
-    text = text.lower()
-    return set(WORD_RE.findall(text))
+    return set(text.lower().encode("ascii", "replace").translate(_TOKEN_TABLE).decode("ascii").split())
 
 
 def _similarity(a: str, b: str) -> float:
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from typing import List, Optional, Dict
 from enum import Enum
 from datetime import date
@@ -80,7 +80,7 @@ class MediaFormat(Enum):
 # 3. DATACLASSES (Estructura de Datos)
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ExternalIDs:
     """Almacena todos los IDs foráneos para cruzar bases de datos."""
     musicbrainz_track_id: Optional[str] = None
@@ -94,14 +94,14 @@ class ExternalIDs:
     spotify_url: Optional[str] = None
     discogs_release_url: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class AudioFeatures:
     """Datos psicoacústicos."""
     # REVERTED: BPM and Audio Features Removed (Phase 17 - API 403 Restriction)
     is_explicit: bool = False
     duration_ms: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class EditorialMetadata:
     """Datos enriquecidos de catálogo (Discogs/MB)."""
     publisher: Optional[str] = None   # TPUB
@@ -122,7 +122,7 @@ class EditorialMetadata:
     credits_mastering: Optional[str] = None # TXXX:Mastered By (or specific credit role)
     credits_mixing: Optional[str] = None    # TXXX:Mixed By 
     
-@dataclass
+@dataclass(slots=True)
 class UnifiedTrackData:
     """
     OBJETO MAESTRO.
@@ -147,6 +147,11 @@ class UnifiedTrackData:
     filepath_original: str = ""
     filename_new: str = ""      # Propuesta de renombrado
     match_confidence: float = 0.0 # 0.0 a 1.0 (Semáforo)
+
+    # 4. Portada temporal (la rellena el pipeline antes de escribir tags).
+    # Declarados como campos: con slots=True no se pueden añadir atributos al vuelo.
+    temp_cover_url: Optional[str] = field(default=None, repr=False)
+    temp_cover_bytes: Optional[bytes] = field(default=None, repr=False)
     
     def __post_init__(self):
         """
@@ -181,6 +186,6 @@ class UnifiedTrackData:
         return {
             "title": self.title,
             "artist": self.artist_main,
-            "ids": self.ids.__dict__,
+            "ids": asdict(self.ids),
             # ... resto de campos
         }
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from dataclasses import dataclass
+from mp3_autotagger.config import UNKNOWN_ARTIST
 from mp3_autotagger.services.identity import TrackIdentity
 from mp3_autotagger.clients.discogs import DiscogsClient
 from mp3_autotagger.clients.spotify import SpotifyClient
@@ -352,7 +353,7 @@ class EnrichmentService:
                  # Phase 22: Free Search Fallback
                  # If artist is unknown/empty, we treat the Title as the full query (e.g. filename)
                  is_free_search = False
-                 if not raw_artist or raw_artist in ["Unknown Artist", "Unknown"]:
+                 if not raw_artist or raw_artist in (UNKNOWN_ARTIST, "Unknown"):
                      print(f"  -> [Enrichment] Artista desconocido. Activando Free Search con Título: '{raw_title}'")
                      search_artist = ""
                      # Nuclear cleaning for title in free search is risky, better keep it broad or clean lightly
@@ -30,12 +30,15 @@ class IdentityService:
         self.spotify = spotify_client
         self.mb = mb_client
 
-    def identify_track(self, file_path: str) -> Optional[TrackIdentity]:
+    def identify_track(self, file_path: str, duration: Optional[float] = None) -> Optional[TrackIdentity]:
         """
         Intelligent identification strategy:
         1. AcoustID (High precision, ignores filenames).
         2. Spotify Broad Search (Best text parsing).
         3. MusicBrainz Search (Structuring).
+
+        duration: duración local en segundos si el llamador ya la leyó
+        (el pipeline la tiene de analyze_file); si no, se lee aquí.
         """
         filename = os.path.basename(file_path)
         
@@ -70,9 +73,10 @@ class IdentityService:
                     
                 # 2. Duration Check
                 if is_valid and best.duration_ms:
-                    local_info = analyze_file(file_path)
-                    if local_info["duration"]:
-                        diff = abs(local_info["duration"] - (best.duration_ms / 1000.0))
+                    if duration is None:
+                        duration = analyze_file(file_path)["duration"]
+                    if duration:
+                        diff = abs(duration - (best.duration_ms / 1000.0))
                         if diff > 5.0:
                              print(f"     [Strict] Identity descartada por duración (Diff: {diff:.1f}s)")
                              is_valid = False
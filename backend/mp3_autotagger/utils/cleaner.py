@@ -1,6 +1,31 @@
 import re
 import os
 
+# Basura conocida que se elimina tal cual del nombre
+_GARBAGE = (
+    "Unknown Artist",
+    "Unknown Artist -", 
+    "www.mp3", 
+    "Youtube Rip",
+    "y2mate.com",
+    "y2mate",
+    "www.youtube.com",
+    "_320kbps",
+    "320kbps",
+    "(Original Mix)", # Optional: User didn't strictly ask to remove this but it helps search. 
+                      # Actually user example 'Munbo Gumbo (Original Mix)' kept it in title, 
+                      # but for SEARCH it might be better to keep or remove?
+                      # User code sample: `basura = ["Unknown Artist", ...]`
+                      # I will stick to the user's explicit list + obvious functional noise.
+)
+
+# Regex precompiladas (ver clean() para qué limpia cada una)
+_RE_CAMELOT_BPM = re.compile(r'^\d{1,2}[A-Z]\s+-\s+\d{2,3}\s+-\s+')
+_RE_CAMELOT = re.compile(r'^\d{1,2}[A-Z]\s+-\s+')
+_RE_TRACK_NUM = re.compile(r'^\d{2,3}\s*[-.]\s+')
+_RE_WS = re.compile(r'\s+')
+
+
 class FilenameCleaner:
     """
     Utility to clean filenames from common DJ/Rip noise before searching.
@@ -13,30 +38,13 @@ class FilenameCleaner:
 
     @staticmethod
     def clean(filename: str) -> str:
-        # 1. Base Cleanup of known garbage strings
-        garbage = [
-            "Unknown Artist",
-            "Unknown Artist -", 
-            "www.mp3", 
-            "Youtube Rip",
-            "y2mate.com",
-            "y2mate",
-            "www.youtube.com",
-            "_320kbps",
-            "320kbps",
-            "(Original Mix)", # Optional: User didn't strictly ask to remove this but it helps search. 
-                              # Actually user example 'Munbo Gumbo (Original Mix)' kept it in title, 
-                              # but for SEARCH it might be better to keep or remove?
-                              # User code sample: `basura = ["Unknown Artist", ...]`
-                              # I will stick to the user's explicit list + obvious functional noise.
-        ]
-        
+        # 1. Base Cleanup of known garbage strings (ver _GARBAGE)
         cleaned = os.path.basename(filename)
         # Remove extension for processing
         name, ext = os.path.splitext(cleaned)
         cleaned = name
 
-        for g in garbage:
+        for g in _GARBAGE:
             cleaned = cleaned.replace(g, "")
 
         # 2. Regex Cleanup for Prefixes
@@ -44,17 +52,17 @@ class FilenameCleaner:
         # Camelot Key + BPM: "2A - 125 - " or "2A - 125 "
         # Pattern: Start of string, 1-2 digits, 1 letter, optionally ' - ', 2-3 digits, optionally ' - '
         # Regex: ^\d{1,2}[A-Z]\s+-\s+\d{2,3}\s+-\s+
-        cleaned = re.sub(r'^\d{1,2}[A-Z]\s+-\s+\d{2,3}\s+-\s+', '', cleaned)
+        cleaned = _RE_CAMELOT_BPM.sub('', cleaned)
         
         # Simple Camelot: "2A - "
-        cleaned = re.sub(r'^\d{1,2}[A-Z]\s+-\s+', '', cleaned)
+        cleaned = _RE_CAMELOT.sub('', cleaned)
 
         # Track Numbers: "01 - " or "01. "
-        cleaned = re.sub(r'^\d{2,3}\s*[-.]\s+', '', cleaned)
+        cleaned = _RE_TRACK_NUM.sub('', cleaned)
 
         # 3. Final Polish
         cleaned = cleaned.replace("_", " ").strip()
-        cleaned = re.sub(r'\s+', ' ', cleaned) # Collapse multiple spaces
+        cleaned = _RE_WS.sub(' ', cleaned) # Collapse multiple spaces
         
         # Remove explicit " - " at start if it remains
         if cleaned.startswith("- "):
@@ -1,6 +1,79 @@
+import threading
 import requests
+from functools import lru_cache
+from io import BytesIO
 from typing import Optional
 
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+from mp3_autotagger.utils.cache import get_cached_session
+
+# Tope de la portada que se embebe (APIC): lado máximo en px y tamaño en bytes
+# por debajo del cual se deja el JPEG original tal cual
+COVER_MAX_SIDE = 600
+COVER_MAX_BYTES = 200 * 1024
+
+# Sesión con caché en disco (requests-cache/SQLite) para portadas: entre
+# corridas, una portada ya descargada no vuelve a la red. Se crea al primer uso.
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _image_session() -> requests.Session:
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = get_cached_session(cache_name="image_cache", expire_after_days=30)
+    return _session
+
+
+def _bound_cover(raw: bytes) -> bytes:
+    """
+    Reduce la portada a un JPEG de como mucho COVER_MAX_SIDE px por lado.
+    Sin Pillow, o si la imagen no se puede leer, devuelve los bytes originales.
+    """
+    if not HAS_PIL:
+        return raw
+    try:
+        img = Image.open(BytesIO(raw))
+        if (img.format == "JPEG" and len(raw) <= COVER_MAX_BYTES
+                and max(img.size) <= COVER_MAX_SIDE):
+            return raw
+        img.thumbnail((COVER_MAX_SIDE, COVER_MAX_SIDE), Image.LANCZOS)
+        buf = BytesIO()
+        # El Tagger escribe el APIC como image/jpeg: siempre se re-codifica a JPEG
+        img.convert("RGB").save(buf, "JPEG", quality=85, optimize=True)
+        return buf.getvalue()
+    except Exception as e:
+        print(f"[Image] Advertencia: no se pudo reducir la portada ({e})")
+        return raw
+
+
+@lru_cache(maxsize=32)
+def _fetch_image(url: str, timeout: int) -> bytes:
+    """
+    Descarga memoizada por URL: todos los tracks de un álbum comparten portada.
+    Se memoiza ya reducida (_bound_cover), así cada archivo en vuelo comparte
+    los mismos bytes acotados.
+    Lanza excepción si falla (lru_cache no guarda excepciones, así un error
+    transitorio no queda cacheado).
+    """
+    headers = {"User-Agent": "MP3-Metadata-Pipeline/1.0"}
+    resp = _image_session().get(url, headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    
+    ct = resp.headers.get("Content-Type", "")
+    if "image" not in ct:
+        print(f"[Image] Advertencia: Content-Type no es imagen ({ct}) para {url}")
+        
+    return _bound_cover(resp.content)
+
+
 def download_image(url: str, timeout: int = 10) -> Optional[bytes]:
     """
     Descarga una imagen desde una URL y retorna sus bytes.
@@ -10,18 +83,8 @@ def download_image(url: str, timeout: int = 10) -> Optional[bytes]:
         return None
         
     try:
-        # Usamos requests directo (sin cache persistente para imagenes, 
-        # aunque requests-cache podría cachearlas si usamos una session cacheada)
-        # Por ahora simple requests.get
-        headers = {"User-Agent": "MP3-Metadata-Pipeline/1.0"}
-        resp = requests.get(url, headers=headers, timeout=timeout)
-        resp.raise_for_status()
-        
-        ct = resp.headers.get("Content-Type", "")
-        if "image" not in ct:
-            print(f"[Image] Advertencia: Content-Type no es imagen ({ct}) para {url}")
-            
-        return resp.content
+        # Memo en memoria (_fetch_image) delante de la caché en disco
+        return _fetch_image(url, timeout)
     except Exception as e:
         print(f"[Image] Error descargando imagen {url}: {e}")
         return None
@@ -36,14 +36,34 @@ def normalize_unicode(text: str) -> str:
     return text
 
 
+def _strip_combining(text: str) -> str:
+    nfkd_form = unicodedata.normalize('NFKD', text)
+    return "".join([c for c in nfkd_form if not unicodedata.combining(c)])
+
+
+# Latin-1 + Latin Extended-A/B -> ASCII, derivada de _strip_combining para que
+# el atajo con translate dé exactamente lo mismo que el camino NFKD
+_ACCENT_TABLE = {
+    cp: plain
+    for cp in range(0xC0, 0x250)
+    if (plain := _strip_combining(chr(cp))).isascii() and plain != chr(cp)
+}
+
+
 def remove_accents(text: str) -> str:
     """
     Elimina acentos y diacríticos, convirtiendo a ASCII aproximado.
     Ej: 'Sébastien' -> 'Sebastien'
     """
     text = _to_str(text)
-    nfkd_form = unicodedata.normalize('NFKD', text)
-    return "".join([c for c in nfkd_form if not unicodedata.combining(c)])
+    if text.isascii():
+        return text
+    # Caso habitual (acentos latinos): una pasada de translate. Si queda algo
+    # fuera de ASCII (otros scripts, ligaduras, marcas sueltas) se usa NFKD.
+    plain = text.translate(_ACCENT_TABLE)
+    if plain.isascii():
+        return plain
+    return _strip_combining(text)
 
 
 def strip_brackets(text: str) -> str:
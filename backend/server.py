@@ -19,6 +19,7 @@ class ScanRequest(BaseModel):
     path: str
     dry_run: bool = True
     use_discogs: bool = True
+    force_refetch: bool = False
 
 class ProcessingStatus(BaseModel):
     processed: int
@@ -56,7 +57,7 @@ async def start_scan(request: ScanRequest):
 
     # Launch background task (Thread for now to avoid blocking async loop)
     # En producción idealmente usar Celery o BackgroundTasks de FastAPI
-    threading.Thread(target=run_scan_thread, args=(request.path, request.dry_run, request.use_discogs)).start()
+    threading.Thread(target=run_scan_thread, args=(request.path, request.dry_run, request.use_discogs, request.force_refetch)).start()
 
     return {"message": "Scan started", "config": request}
 
@@ -65,7 +66,7 @@ def get_progress():
     return current_status
 
 # --- Background Worker ---
-def run_scan_thread(path: str, dry_run: bool, use_discogs: bool):
+def run_scan_thread(path: str, dry_run: bool, use_discogs: bool, force_refetch: bool = False):
     global current_status, manager_instance
     print(f"[API] Starting scan on {path}")
     
@@ -73,7 +74,7 @@ def run_scan_thread(path: str, dry_run: bool, use_discogs: bool):
         # Dummy Output Path for now (UI Flow will handle this later)
         output_path = os.path.join(path, "clean_output_temp")
         
-        manager = LibraryManager(use_discogs=use_discogs, dry_run=dry_run)
+        manager = LibraryManager(use_discogs=use_discogs, dry_run=dry_run, force_refetch=force_refetch)
         
         # NOTE: Necesitamos modificar LibraryManager para que reporte progreso 
         # a nuestra variable global `current_status`. 
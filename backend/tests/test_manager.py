@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from mp3_autotagger.core import manager as manager_mod
+from mp3_autotagger.core.manager import LibraryManager
+
+class AppendingTagger:
+    """Simula el Tagger: escribir tags cambia tamaño y mtime del archivo."""
+    def write_metadata(self, track_meta):
+        with open(track_meta.filepath_original, "ab") as f:
+            f.write(b"ID3-TAGS")
+        return True
+
+def matched_result(path):
+    ids = SimpleNamespace(musicbrainz_track_id="mbid", discogs_release_id=None, spotify_id=None)
+    tm = SimpleNamespace(ids=ids, match_confidence=0.95, filepath_original=path)
+    return SimpleNamespace(
+        track_metadata=tm, discogs_result=None, spotify_used=False, local_only=False,
+        get_display_title=lambda: "Title", get_display_artist=lambda: "Artist",
+    )
+
+def local_result(path):
+    result = matched_result(path)
+    result.local_only = True
+    return result
+
+class TestCopySkip(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.tmp.name, "raw", "song.mp3")
+        self.dest = os.path.join(self.tmp.name, "clean", "song.mp3")
+        os.makedirs(os.path.dirname(self.src))
+        with open(self.src, "wb") as f:
+            f.write(b"\xff\xfb" * 512)
+        os.utime(self.src, (1_600_000_000, 1_600_000_000))
+
+        pipeline_patch = patch('mp3_autotagger.core.manager.PipelineCore', MagicMock())
+        pipeline_patch.start()
+        self.addCleanup(pipeline_patch.stop)
+        self.manager = LibraryManager(dry_run=False)
+        self.manager.tagger = AppendingTagger()
+        self.manager.pipeline.process_file.side_effect = matched_result
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_tagged_rerun_skips_copy(self):
+        with patch.object(manager_mod, "_fast_copy", wraps=manager_mod._fast_copy) as copy:
+            self.manager._process_single_file(self.src, self.dest)
+            self.manager._process_single_file(self.src, self.dest)
+
+        self.assertEqual(copy.call_count, 1)
+        # dest quedó etiquetado (más grande que src) pero con el mtime del origen
+        self.assertGreater(os.path.getsize(self.dest), os.path.getsize(self.src))
+        self.assertEqual(int(os.path.getmtime(self.dest)), int(os.path.getmtime(self.src)))
+
+    def test_modified_source_is_copied_again(self):
+        with patch.object(manager_mod, "_fast_copy", wraps=manager_mod._fast_copy) as copy:
+            self.manager._process_single_file(self.src, self.dest)
+            os.utime(self.src, (1_700_000_000, 1_700_000_000))
+            self.manager._process_single_file(self.src, self.dest)
+
+        self.assertEqual(copy.call_count, 2)
+
+    def test_local_only_result_points_at_dest(self):
+        """apply_batch renombra filepath_original: nunca debe ser el archivo de entrada."""
+        self.manager.pipeline.process_file.side_effect = local_result
+        self.manager.tagger = MagicMock()
+
+        result = self.manager._process_single_file(self.src, self.dest)
+
+        self.assertEqual(result.track_metadata.filepath_original, self.dest)
+        self.manager.tagger.write_metadata.assert_not_called()
+        self.assertTrue(os.path.exists(self.dest))
+
+class TestSubmitFile(unittest.TestCase):
+    def setUp(self):
+        with patch('mp3_autotagger.core.manager.PipelineCore', MagicMock()):
+            self.manager = LibraryManager(dry_run=True)
+
+    def test_io_stage_start_failure_resolves_future(self):
+        """Si encolar la etapa IO falla, el Future debe resolverse (si no, wait() se cuelga)."""
+        io_pool = MagicMock()
+        io_pool.submit.side_effect = RuntimeError("cannot schedule new futures after shutdown")
+        with ThreadPoolExecutor(max_workers=1) as net_pool:
+            fut = self.manager._submit_file(net_pool, io_pool, None, "a.mp3", "b.mp3", 1, 1)
+            with self.assertRaises(RuntimeError):
+                fut.result(timeout=5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from mp3_autotagger.core.matching import DiscogsReleaseCandidate, _score_discogs_candidate_against_mb
+from mp3_autotagger.data_structures.schemas import UnifiedTrackData
+
+def mb_track(title, artist, album, release_date=None, country=None):
+    track = UnifiedTrackData(
+        title=title, artist_main=artist, album=album, album_artist="",
+        genre_main="", track_number="", disc_number="", year="",
+    )
+    track.editorial.release_date = release_date
+    track.editorial.country = country
+    return track
+
+def candidate(title, year=None, country=None, formats=(), styles=()):
+    return DiscogsReleaseCandidate(
+        id=1, title=title, artist=None, year=year, country=country, label=None, catno=None,
+        formats=list(formats), styles=list(styles),
+    )
+
+class TestDiscogsScoring(unittest.TestCase):
+    def assertScore(self, track, cand, expected):
+        self.assertAlmostEqual(_score_discogs_candidate_against_mb(track, cand), expected, places=6)
+
+    def test_dj_mix_and_genre_bonus(self):
+        """Release DJ mix con estilo House frente a un track MB de un DJ mix house."""
+        track = mb_track("Lady", "Modjo", "Clubland DJ Mix House", "2000")
+        # artista 0.40 + release 0.20 + año 0.20 + boost release 0.10
+        # - mixed 0.10 + DJ mix 0.10 + estilo 0.05
+        self.assertScore(track, candidate("Modjo - Clubland DJ Mix House", 2000,
+                                          formats=["CD", "Mixed"], styles=["House"]), 0.95)
+        # Mismo release sin estilo de género: pierde solo el bonus de estilo
+        self.assertScore(track, candidate("Modjo - Clubland DJ Mix House", 2000,
+                                          formats=["CD", "Mixed"], styles=["Pop"]), 0.90)
+
+    def test_known_scores(self):
+        """Valores fijos del scoring (equivalencia con la implementación original)."""
+        # artista 0.40 + título 0.30*1/4 + release 0.20*1/4 + año (±1) 0.10
+        self.assertScore(mb_track("Lady", "Modjo", "Lady", "2000-10-02", "FR"),
+                         candidate("Modjo - Lady (Hear Me Tonight)", 2001, "UK", ["Vinyl"]), 0.625)
+        # Match exacto con país: se satura en 1.0
+        self.assertScore(mb_track("Lady", "Modjo", "Lady", "2000", "FR"),
+                         candidate("Modjo - Lady", 2000, "FR"), 1.0)
+        # Año a 12 años: -0.05 en vez de bonus
+        self.assertScore(mb_track("Lady", "Modjo", "Lady", "2000"),
+                         candidate("Modjo - Lady", 2012), 0.95)
+        # Compilación Discogs para un single MB: artista 0.40 + año 0.20 - 0.20
+        self.assertScore(mb_track("Lady", "Modjo", "Lady", "2000"),
+                         candidate("Modjo - Greatest Hits", 2000, formats=["CD", "Compilation"]), 0.40)
+        # Compilación mixed de otro artista: negativo, se recorta a 0.0
+        self.assertScore(mb_track("Lady", "Modjo", "Lady", "2000"),
+                         candidate("Various - Best Of House 2000", 2000,
+                                   formats=["CD", "Compilation", "Mixed"], styles=["House"]), 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
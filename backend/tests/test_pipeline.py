@@ -0,0 +1,99 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from mp3_autotagger.core.acoustid import analyze_file
+from mp3_autotagger.core.pipeline import PipelineCore, _artist_similarity
+
+class RemoteCalled(Exception):
+    pass
+
+class FakeID3(dict):
+    """Tags mínimos de Mutagen: acceso por frame id + getall()."""
+    def getall(self, key):
+        return self.get("_" + key, [])
+
+TAGGED = {
+    "TIT2": "The Way Back", "TPE1": "Solomun", "TALB": "The Way Back EP",
+    "TCON": "Deep House", "TDRC": "2003-05-12", "TPUB": "Diynamic",
+    "MusicBrainz Track Id": "0f3c-mbid",
+}
+
+class TestArtistSimilarity(unittest.TestCase):
+    def test_latin_names(self):
+        self.assertEqual(_artist_similarity("Daft Punk", "daft punk"), 1.0)
+        self.assertEqual(_artist_similarity("Daft Punk,", "Daft Punk"), 1.0)
+        self.assertAlmostEqual(_artist_similarity("Daft Punk", "Daft Punk & Pharrell"), 2 / 3)
+        self.assertEqual(_artist_similarity("Daft Punk", "Solomun"), 0.0)
+
+    def test_accented_names(self):
+        self.assertEqual(_artist_similarity("Beyoncé", "Beyonce"), 1.0)
+        self.assertEqual(_artist_similarity("Sébastien Léger", "SEBASTIEN LEGER"), 1.0)
+
+    def test_non_latin_names(self):
+        """Nombres en otros scripts no deben quedar vacíos (sim 0.0 -> Discogs descartado)."""
+        for name in ("Кино", "宇多田ヒカル", "Σωκράτης"):
+            self.assertEqual(_artist_similarity(name, name), 1.0, name)
+        self.assertEqual(_artist_similarity("Кино", "КИНО"), 1.0)
+        self.assertEqual(_artist_similarity("Кино", "Аквариум"), 0.0)
+
+    def test_empty_names(self):
+        self.assertEqual(_artist_similarity("", "Daft Punk"), 0.0)
+        self.assertEqual(_artist_similarity(None, None), 0.0)
+
+class TestAnalyzeFile(unittest.TestCase):
+    @patch('mp3_autotagger.core.acoustid.MutagenFile')
+    def test_reads_date_publisher_and_ids(self, mock_file):
+        tags = FakeID3(TIT2="T", TPE1="A", TALB="Al", TCON="House", TDRC="2003-05-12", TPUB="Lab")
+        tags["_APIC"] = [SimpleNamespace(data=b"img")]
+        tags["_TXXX"] = [
+            SimpleNamespace(desc="MusicBrainz Track Id", text=["mbid"]),
+            SimpleNamespace(desc="Discogs Release Id", text=["123"]),
+            SimpleNamespace(desc="Otro", text=["x"]),
+        ]
+        mock_file.return_value = SimpleNamespace(info=SimpleNamespace(length=200.0), tags=tags)
+
+        info = analyze_file("song.mp3")
+
+        self.assertEqual(info["duration"], 200.0)
+        self.assertEqual(info["cover"], b"img")
+        self.assertEqual(info["tags"]["TDRC"], "2003-05-12")
+        self.assertEqual(info["tags"]["TPUB"], "Lab")
+        self.assertEqual(info["tags"]["MusicBrainz Track Id"], "mbid")
+        self.assertEqual(info["tags"]["Discogs Release Id"], "123")
+        self.assertNotIn("Otro", info["tags"])
+
+@patch('mp3_autotagger.core.pipeline.EnrichmentService', MagicMock())
+@patch('mp3_autotagger.core.pipeline.IdentityService', MagicMock())
+@patch('mp3_autotagger.core.pipeline.MusicBrainzClient', MagicMock())
+class TestLocalShortCircuit(unittest.TestCase):
+    def _process(self, tags, **kwargs):
+        pipeline = PipelineCore(use_discogs=False, use_spotify=False, **kwargs)
+        base_info = {"duration": 200.0, "tags": dict(tags), "cover": None}
+        # Si el pipeline sale a la red, AcoustID es lo primero que consulta
+        with patch('mp3_autotagger.core.pipeline.analyze_file', return_value=base_info), \
+             patch('mp3_autotagger.core.pipeline.identify_with_acoustid', side_effect=RemoteCalled):
+            return pipeline.process_file("/music/Solomun - The Way Back.mp3")
+
+    def test_complete_local_tags_skip_remote(self):
+        result = self._process(TAGGED)
+
+        self.assertTrue(result.local_only)
+        tm = result.track_metadata
+        self.assertEqual(tm.title, "The Way Back")
+        self.assertEqual(tm.year, "2003-05-12")  # fecha completa, sin recortar
+        self.assertEqual(tm.editorial.publisher, "Diynamic")
+        self.assertEqual(tm.ids.musicbrainz_track_id, "0f3c-mbid")
+        self.assertEqual(tm.match_confidence, 0.0)
+
+    def test_missing_field_or_id_goes_remote(self):
+        for missing in ("TDRC", "MusicBrainz Track Id"):
+            tags = {k: v for k, v in TAGGED.items() if k != missing}
+            with self.assertRaises(RemoteCalled, msg=missing):
+                self._process(tags)
+
+    def test_force_refetch_goes_remote(self):
+        with self.assertRaises(RemoteCalled):
+            self._process(TAGGED, force_refetch=True)
+
+if __name__ == '__main__':
+    unittest.main()
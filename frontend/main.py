@@ -45,7 +45,7 @@ def main(page: ft.Page):
     
     # --- Controller Logic ---
     
-    def on_start_scan(path, dry_run, use_discogs):
+    def on_start_scan(path, dry_run, use_discogs, force_refetch=False):
         """Callback triggered by Dashboard Scan Button"""
         if not path or not os.path.exists(path):
             dashboard.add_log(f"Error: Ruta inválida {path}")
@@ -53,7 +53,7 @@ def main(page: ft.Page):
             return
 
         # Run in Thread
-        t = threading.Thread(target=run_backend_logic, args=(path, dry_run, use_discogs))
+        t = threading.Thread(target=run_backend_logic, args=(path, dry_run, use_discogs, force_refetch))
         t.start()
         
     def on_commit(indices):
@@ -73,7 +73,7 @@ def main(page: ft.Page):
         t = threading.Thread(target=run_commit)
         t.start()
 
-    def run_backend_logic(path, is_dry, use_discogs):
+    def run_backend_logic(path, is_dry, use_discogs, force_refetch=False):
         global manager
         
         # --- UI Callback ---
@@ -92,8 +92,9 @@ def main(page: ft.Page):
                 
                 # Add Row to Grid
                 if details:
-                    # Inject index for callback
-                    details["index"] = len(dashboard.data_table.rows) 
+                    # El backend manda la posición del archivo en el escaneo;
+                    # si no viene, caemos al orden de llegada
+                    details.setdefault("index", len(dashboard.data_table.rows))
                     dashboard.add_row(details)
                 
                 page.update()
@@ -109,7 +110,8 @@ def main(page: ft.Page):
              page.update()
              
              # Connect to Manager Logic
-             manager = LibraryManager(use_discogs=use_discogs, dry_run=is_dry, progress_callback=on_progress)
+             manager = LibraryManager(use_discogs=use_discogs, dry_run=is_dry, progress_callback=on_progress,
+                                      force_refetch=force_refetch)
              
              # Show loading state logic could go here if we had a specific spinner
              
@@ -15,6 +15,9 @@ class DashboardView(ft.Container):
         # --- State ---
         self.scan_results = [] 
         self.selected_indices = set()
+        # details["index"] (posición en el escaneo) -> fila de la tabla. No coincide
+        # con la posición en data_table.rows: los archivos sin match no tienen fila.
+        self._rows_by_index = {}
         
         # Column Config (Key -> Label)
         self.all_columns = {
@@ -81,6 +84,8 @@ class DashboardView(ft.Container):
         self.chk_dry_run = ft.Switch(label="DRY RUN", value=True, active_color="#FF9800", label_style=ft.TextStyle(size=11, color="#AAAAAA"))
         self.chk_discogs = ft.Switch(label="DISCOGS", value=True, active_color="#2979FF", label_style=ft.TextStyle(size=11, color="#AAAAAA"))
         self.chk_strict = ft.Switch(label="STRICT", value=True, active_color="#D50000", label_style=ft.TextStyle(size=11, color="#AAAAAA"))
+        # Re-consultar servicios aunque el archivo ya tenga tags completos
+        self.chk_refetch = ft.Switch(label="REFETCH", value=False, active_color="#00B0FF", label_style=ft.TextStyle(size=11, color="#AAAAAA"))
         
         self.btn_scan = ft.ElevatedButton(
             "SCAN", 
@@ -175,8 +180,11 @@ class DashboardView(ft.Container):
     def _refresh_table(self):
         self.data_table.columns = self._build_columns()
         self.data_table.rows.clear()
-        for idx, details in enumerate(self.scan_results):
-            self.data_table.rows.append(self._create_row(details))
+        self._rows_by_index.clear()
+        for details in self.scan_results:
+            row = self._create_row(details)
+            self.data_table.rows.append(row)
+            self._rows_by_index[details.get("index", -1)] = row
 
     def _create_row(self, details: Dict[str, Any]):
         idx = details.get("index", -1)
@@ -212,6 +220,9 @@ class DashboardView(ft.Container):
                 elif "MusicBrainz" in src:
                     icon = ft.Icons.LIBRARY_MUSIC
                     col = ft.Colors.PURPLE
+                elif src == "Local":
+                    icon = ft.Icons.FOLDER
+                    col = ft.Colors.GREY
                 content = ft.Icon(icon, color=col, size=16, tooltip=src)
             
             elif key == "confidence":
@@ -318,7 +329,7 @@ class DashboardView(ft.Container):
                     ),
                     ft.VerticalDivider(width=20, color="transparent"),
                     # Toggles (Compact)
-                    ft.Row([self.chk_dry_run, self.chk_discogs, self.chk_strict], spacing=5),
+                    ft.Row([self.chk_dry_run, self.chk_discogs, self.chk_strict, self.chk_refetch], spacing=5),
                     ft.VerticalDivider(width=20, color="#333333"),
                     # Actions
                     self.btn_scan,
@@ -385,6 +396,7 @@ class DashboardView(ft.Container):
         # Optimize: Append only, don't rebuild
         row = self._create_row(details)
         self.data_table.rows.append(row)
+        self._rows_by_index[idx] = row
         
         # Auto-select if READY/RESCUED logic (optional)
         # User requested stricter confidence. Only > 90% auto-selected.
@@ -398,11 +410,10 @@ class DashboardView(ft.Container):
         else:
             self.selected_indices.discard(idx)
             
-        # FORCE UI STATE SYNC (Correcting for 1-based index from manager)
-        # manager passes 1-based index, DataTable rows are 0-based.
-        row_idx = idx - 1
-        if 0 <= row_idx < len(self.data_table.rows):
-            self.data_table.rows[row_idx].selected = is_selected
+        # FORCE UI STATE SYNC: la fila se busca por su índice de escaneo
+        row = self._rows_by_index.get(idx)
+        if row is not None:
+            row.selected = is_selected
         
         self.btn_commit.text = f"COMMIT ({len(self.selected_indices)})"
         self.page.update() # Force full update to ensure checkboxes reflect state
@@ -416,6 +427,7 @@ class DashboardView(ft.Container):
              
         # Clear UI
         self.data_table.rows.clear()
+        self._rows_by_index.clear()
         self.scan_results.clear()
         self.log_list.controls.clear()
         self.selected_indices.clear()
@@ -424,7 +436,7 @@ class DashboardView(ft.Container):
         self.progress_bar.visible = True 
         self.page.update()
         
-        self.on_start_scan(path, self.chk_dry_run.value, self.chk_discogs.value)
+        self.on_start_scan(path, self.chk_dry_run.value, self.chk_discogs.value, self.chk_refetch.value)
         
     def _handle_commit(self, e):
         if not self.selected_indices: